@@ -1,42 +1,108 @@
 #!/usr/bin/env python
 
-import sys
+import heapq
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-def part1(inputFile):
-    fd = open(inputFile, "r")
-    lines = fd.readlines()
-    sums = []
-    curr = 0
-    for l in lines:
-        if l == "\n":
-            sums.append(curr)
-            curr = 0
-        else:
-            curr += int(l)
-    # Last elf does not have a blank line after it.
-    sums.append(curr)
-    return max(sums)
+if not __package__:
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-def part2(inputFile):
+# Number of elves whose total is kept, part 2 needs the top 3.
+TOP_K = 3
+
+# Inputs at least this big are summed in parallel, if there is more than one
+# CPU. Below that, starting the worker processes costs more than it saves.
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+# Read the input file and return a tuple containing the `k` largest totals of
+# calories carried by an elf, in decreasing order.
+# The file is read one line at a time and only the `k` largest totals seen so
+# far are kept, in a min-heap, so the memory does not depend on the size of the
+# input.
+def topCalories(inputFile, k):
     fd = open(inputFile, "r")
-    lines = fd.readlines()
-    sums = []
+    top = []
     curr = 0
-    for l in lines:
+    def push(total):
+        if len(top) < k:
+            heapq.heappush(top, total)
+        elif total > top[0]:
+            heapq.heapreplace(top, total)
+    for l in fd:
         if l == "\n":
-            sums.append(curr)
+            push(curr)
             curr = 0
         else:
             curr += int(l)
     # Last elf does not have a blank line after it.
-    sums.append(curr)
-    sums.sort()
-    return sum(sums[-3:])
+    push(curr)
+    fd.close()
+    return tuple(sorted(top, reverse=True))
+
+# Same as topCalories, for the part of the input file in [start, end). The
+# part must start at the beginning of an elf and end after a blank line or at
+# the end of the file.
+def chunkTopCalories(inputFile, start, end, k):
+    fd = open(inputFile, "rb")
+    mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    # int() parses the bytes directly, no str is created. A part ending with a
+    # blank line has an empty last elf.
+    sums = (sum(map(int, elf.split())) \
+            for elf in mm[start:end].split(b"\n\n") if elf)
+    top = heapq.nlargest(k, sums)
+    mm.close()
+    fd.close()
+    return top
+
+# Split the input file in about `num` parts at blank lines. Returns the list of
+# (start, end) of the parts.
+def splitAtBlankLines(mm, num):
+    size = len(mm)
+    bounds = [0]
+    for i in range(1, num):
+        # Cut after the first blank line following the ideal cut.
+        pos = mm.find(b"\n\n", max(bounds[-1], i * size // num))
+        if pos < 0:
+            break
+        bounds.append(pos + 2)
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) \
+            if bounds[i] < bounds[i + 1]]
+
+# Same as topCalories, but the input file is memory-mapped and cut into parts
+# that are summed by `workers` processes. Each worker returns the top `k` of its
+# part and the results are merged. The main process only looks for the blank
+# lines where to cut.
+def topCaloriesParallel(inputFile, k, workers):
+    fd = open(inputFile, "rb")
+    mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    # A few parts per worker evens out the work if some parts are slower.
+    parts = splitAtBlankLines(mm, 4 * workers)
+    mm.close()
+    fd.close()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tops = executor.map(chunkTopCalories, [inputFile] * len(parts),
+                            [p[0] for p in parts], [p[1] for p in parts],
+                            [k] * len(parts))
+        return tuple(heapq.nlargest(k, (s for t in tops for s in t)))
+
+# Parse the input file and return a tuple containing the TOP_K largest totals
+# of calories carried by an elf, in decreasing order.
+def parseInput(inputFile):
+    workers = os.cpu_count() or 1
+    if workers > 1 and os.path.getsize(inputFile) >= PARALLEL_MIN_SIZE:
+        return topCaloriesParallel(inputFile, TOP_K, workers)
+    return topCalories(inputFile, TOP_K)
+
+def part1(top):
+    return top[0]
 
-def main():
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+def part2(top):
+    return sum(top[:3])
 
 if __name__ == "__main__":
-    main();
+    run(parseInput, part1, part2)
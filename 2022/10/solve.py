@@ -1,67 +1,112 @@
 #!/usr/bin/env python
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-def parseInput(inputFile):
-    fd = open(inputFile, "r")
-    lines = list(map(lambda l: l.replace("\n", ""), fd.readlines()))
-    fd.close()
-    return lines
-
-def part1(inputFile):
-    cycle = 0
-    X = 1
+# Cycles during which the signal strength is sampled for part 1.
+SAMPLE_CYCLES = range(20, 221, 40)
 
-    ss = {}
-    def updateSignalStrengths():
-        for i in range(20, 221, 40):
-            if i <= cycle and i not in ss.keys():
-                ss[i] = i * X
+# Size of the CRT in pixels.
+CRT_WIDTH = 40
+CRT_HEIGHT = 6
 
-    instructions = parseInput(inputFile)
-    for inst in instructions:
-        if inst == "noop":
-            cycle += 1
-            updateSignalStrengths()
+# Decode the lines of a program one at a time. Yield None for a noop and the
+# value to add for an addx.
+def instructions(lines):
+    for l in lines:
+        inst = l.split()
+        if inst[0] == "noop":
+            yield None
         else:
-            assert "addx" in inst
-            v = int(inst.split(" ")[1])
-            cycle += 2
-            updateSignalStrengths()
-            X += v
-    assert len(ss.keys()) == 6
-    return sum(ss.values())
+            assert inst[0] == "addx"
+            yield int(inst[1])
 
-def part2(inputFile):
+# Emulate the CPU running `program`, an iterable of instructions as decoded by
+# instructions().
+# Yield a tuple (cycle, X) for each cycle, X being the value of the register
+# *during* the cycle. Cycles start at 1.
+def cpuCycles(program):
     cycle = 0
     X = 1
-    CRTCol = 0
-
-    # Draw a pixel. n indicates the number of times the operation should be
-    # repeated.
-    def drawPixel(n):
-        nonlocal CRTCol
-        for i in range(n):
-            print("#" if abs(CRTCol - X) <= 1 else ".", end="")
-            CRTCol = (CRTCol + 1) % 40
-            if CRTCol == 0:
-                # new row
-                print("")
-
-    instructions = parseInput(inputFile)
-    for inst in instructions:
-        if inst == "noop":
+    for v in program:
+        cycle += 1
+        yield (cycle, X)
+        if v is not None:
+            # addx takes two cycles, X is only updated after the second one.
             cycle += 1
-            drawPixel(1)
-        else:
-            assert "addx" in inst
-            v = int(inst.split(" ")[1])
-            cycle += 2
-            drawPixel(2)
+            yield (cycle, X)
             X += v
-    return 0
+
+# Consumer of the cycles computing the sum of the signal strengths (cycle * X)
+# during the cycles of `schedule`. The cycles of the schedule after the end of
+# the program are not counted, see done().
+class SignalSampler:
+    def __init__(self, schedule):
+        self.schedule = sorted(set(schedule))
+        # Index of the next cycle to sample in the schedule.
+        self.next = 0
+        self.total = 0
+
+    def consume(self, cycle, X):
+        if self.next < len(self.schedule) and \
+           self.schedule[self.next] == cycle:
+            self.total += cycle * X
+            self.next += 1
+
+    # Return True if all the cycles of the schedule were sampled.
+    def done(self):
+        return self.next == len(self.schedule)
+
+# Consumer of the cycles drawing the CRT, one pixel per cycle. A pixel is lit if
+# the sprite, 3 pixels wide and centered on X, covers the column being drawn.
+# The cycles after the screen is full are ignored.
+class CRT:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.framebuffer = bytearray(b"." * (width * height))
+
+    def consume(self, cycle, X):
+        pixel = cycle - 1
+        if pixel < len(self.framebuffer) and \
+           abs(pixel % self.width - X) <= 1:
+            self.framebuffer[pixel] = ord("#")
+
+    # Return the screen as a string, one line per row.
+    def render(self):
+        rows = [self.framebuffer[y * self.width:(y + 1) * self.width]
+                for y in range(self.height)]
+        return b"\n".join(rows).decode()
+
+# Run `program` once, feeding every cycle to each of the `consumers`.
+def emulate(program, consumers):
+    consume = [c.consume for c in consumers]
+    for cycle, X in cpuCycles(program):
+        for f in consume:
+            f(cycle, X)
+
+# Run the program of the input file once for both parts, streaming its lines
+# into the CPU.
+# Return a tuple (sum of the signal strengths, rendered screen). For a program
+# ending before the last cycle of SAMPLE_CYCLES, the sum only covers the cycles
+# that were reached.
+def parseInput(inputFile):
+    sampler = SignalSampler(SAMPLE_CYCLES)
+    crt = CRT(CRT_WIDTH, CRT_HEIGHT)
+    fd = open(inputFile, "r")
+    emulate(instructions(fd), [sampler, crt])
+    fd.close()
+    return (sampler.total, crt.render())
+
+def part1(res):
+    return res[0]
+
+def part2(res):
+    return res[1]
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
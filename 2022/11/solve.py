@@ -5,10 +5,16 @@
 # Of course there are faster ways to solves this (e.g. by abusing exec()), but
 # this wouldn't be fun without adding an AST in the mix.
 
-import sys
 from abc import ABC, abstractmethod
 from enum import Enum
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
 # A schedule describes what a monkey does with an item, that is how worry levels
 # are updated, what test condition is performed on worry levels and to which
 # monkeys to send the item to.
@@ -115,10 +121,11 @@ class Schedule:
         self.destination = {False: falseMonkey, True: trueMonkey}
         self.div = div
 
-    # Execute the schedule on an item.
+    # Execute the schedule on an item. `kn` is the product of the moduli of all
+    # the monkeys, see below.
     # Return a pair (ID, worryLevel) where ID indicates to which monkey to send
     # the item to and worryLevel is the updated worry level for the item.
-    def destinationMonkeyForItem(self, item):
+    def destinationMonkeyForItem(self, item, kn):
         # The trick:
         # At each turn, we are interested in worryLevel % self.modulus in order
         # to know to which monkey the item should be sent.
@@ -140,18 +147,11 @@ class Schedule:
         # different modulus and therefore we need to choose a k such that
         # k * self.modulus is a multiple of other.modulus.
         # The easy choice is to take k = m0 * m1 * m2 * ... where mi is the
-        # modulus of monkey i.
-        kn = 1
-        for m in MONKEYS:
-            kn *= m.schedule.modulus
-
+        # modulus of monkey i. This is what the caller passes as `kn`.
         worryLevel = (self.operation(item) // self.div) % kn
         d = (worryLevel % self.modulus == 0)
         return (self.destination[d], worryLevel)
 
-# The list of monkeys, indexed by their numerical ID.
-MONKEYS = []
-
 # A monkey. A monkey has a list of item and a schedule that it follows for each
 # item.
 class Monkey:
@@ -160,28 +160,32 @@ class Monkey:
         self.schedule = schedule
         self.inspectedItems = 0
 
-    def doTurn(self):
+    # Perform a turn. `monkeys` is the list of all monkeys, indexed by their
+    # numerical ID, `kn` is the product of their moduli.
+    def doTurn(self, monkeys, kn):
         self.inspectedItems += len(self.items)
         for it in self.items:
-            nextMonkey, worryLevel = self.schedule.destinationMonkeyForItem(it)
-            MONKEYS[nextMonkey].receiveItem(worryLevel)
+            nextMonkey, worryLevel = self.schedule.destinationMonkeyForItem(it, kn)
+            monkeys[nextMonkey].receiveItem(worryLevel)
         self.items = []
 
     def receiveItem(self, item):
         self.items.append(item)
 
 # Perform a full round where each monkey perform a turn once.
-def doRound():
-    for m in MONKEYS:
-        m.doTurn()
-
-# Parse the input file and populates MONKEYS.
-def parseInput(inputFile, part2):
+def doRound(monkeys, kn):
+    for m in monkeys:
+        m.doTurn(monkeys, kn)
+
+# Parse the input file and return a tuple of notes, one per monkey, indexed by
+# their numerical ID. Each note is a tuple (startingItems, operation, modulus,
+# trueMonkey, falseMonkey). The notes are never modified, each part creates its
+# own Monkeys from them.
+def parseInput(inputFile):
     fd = open(inputFile, "r")
     it = iter(fd)
 
-    global MONKEYS
-    MONKEYS = []
+    notes = []
 
     # Iterate over the input file and parse each monkey.
     for line in it:
@@ -196,7 +200,7 @@ def parseInput(inputFile, part2):
         assert "Starting items:" in startingItems
         startingItems = startingItems.split(": ")[1]
         startingItems = startingItems.replace(",", "")
-        startingItems = [int(val) for val in startingItems.split(" ")]
+        startingItems = tuple(int(val) for val in startingItems.split(" "))
 
         # Parse operation.
         operation = next(it).replace("\n", "")
@@ -209,29 +213,37 @@ def parseInput(inputFile, part2):
         modulus = int(testCond.split(" ")[-1])
         trueMonkey = int(next(it).replace("\n", "").split(" ")[-1])
         falseMonkey = int(next(it).replace("\n", "").split(" ")[-1])
-        div = 1 if part2 else 3
-        schedule = Schedule(operation, modulus, trueMonkey, falseMonkey, div)
 
-        MONKEYS.append(Monkey(startingItems, schedule))
+        notes.append((startingItems, operation, modulus, trueMonkey, falseMonkey))
     fd.close()
+    return tuple(notes)
 
-def part1(inputFile):
-    parseInput(inputFile, False)
-
-    for i in range(20):
-        doRound()
-    inspItems = sorted([m.inspectedItems for m in MONKEYS])
+# Create the monkeys described by the notes. The worry level of an item after
+# inspection is divided by `div`.
+def createMonkeys(notes, div):
+    monkeys = []
+    for startingItems, operation, modulus, trueMonkey, falseMonkey in notes:
+        schedule = Schedule(operation, modulus, trueMonkey, falseMonkey, div)
+        monkeys.append(Monkey(list(startingItems), schedule))
+    return monkeys
+
+# Run `numRounds` rounds and compute the level of monkey business.
+def monkeyBusiness(notes, div, numRounds):
+    monkeys = createMonkeys(notes, div)
+    kn = 1
+    for m in monkeys:
+        kn *= m.schedule.modulus
+
+    for i in range(numRounds):
+        doRound(monkeys, kn)
+    inspItems = sorted([m.inspectedItems for m in monkeys])
     return inspItems[-1] * inspItems[-2]
 
-def part2(inputFile):
-    parseInput(inputFile, True)
+def part1(notes):
+    return monkeyBusiness(notes, 3, 20)
 
-    for i in range(10000):
-        doRound()
-    inspItems = sorted([m.inspectedItems for m in MONKEYS])
-    return inspItems[-1] * inspItems[-2]
+def part2(notes):
+    return monkeyBusiness(notes, 1, 10000)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
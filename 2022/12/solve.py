@@ -1,17 +1,12 @@
 #!/usr/bin/env python
 
-import sys
-
-# 2D coordinates in the height map.
-class Position:
-    # Create a Position value for coordinates (x, y)
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    # Compare two Positions.
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
 
 # Keep state of a height map and allows to compute shortest distances between
 # starting points and the end position.
@@ -139,20 +134,16 @@ def parseInput(inputFile):
             assert endPos is None
             endPos = Position(endX, len(grid))
             row = row.replace("E", "z")
-        heights = [ord(c) - ord('a') for c in row]
+        heights = tuple(ord(c) - ord('a') for c in row)
         grid.append(heights)
     fd.close()
-    return HeightMap(grid, startPos, endPos)
+    return HeightMap(tuple(grid), startPos, endPos)
 
-def part1(inputFile):
-    hm = parseInput(inputFile)
+def part1(hm):
     return hm.minStepsFromStart()
 
-def part2(inputFile):
-    hm = parseInput(inputFile)
+def part2(hm):
     return hm.minStepsFromElevation0()
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
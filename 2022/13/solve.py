@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 
-import sys
 from functools import cmp_to_key
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
 # Parse the input file an return a list of pairs.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
@@ -72,7 +78,7 @@ def parseInput(inputFile):
 
         return parse()
 
-    pairs = list(map(lambda p: (parseString(p[0]), parseString(p[1])), pairs))
+    pairs = tuple(map(lambda p: (parseString(p[0]), parseString(p[1])), pairs))
         
     fd.close()
     return pairs
@@ -116,14 +122,12 @@ def compare(l, r):
         else:
             return compareList(l, [r])
 
-def part1(inputFile):
-    pairs = parseInput(inputFile)
+def part1(pairs):
     cmpRes = enumerate([compare(p[0], p[1]) for p in pairs])
     cmpRes = list(filter(lambda r: r[1] == -1, cmpRes))
     return sum(map(lambda r: r[0] + 1, cmpRes))
 
-def part2(inputFile):
-    pairs = parseInput(inputFile)
+def part2(pairs):
     elems = [e for p in pairs for e in p]
     elems.append([[2]])
     elems.append([[6]])
@@ -134,6 +138,4 @@ def part2(inputFile):
     return div1Idx * div2Idx
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
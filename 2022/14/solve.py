@@ -3,56 +3,43 @@
 # Smarter solution that uses DFS instead of running the simulation for each unit
 # of sand.
 
-import sys
 from enum import Enum
-import copy
 
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
 
 class Grid:
-    # Create an empty grid. If `part1` is False then this grid has a floor
-    # otherwise it is floating above the abyss.
+    # Create an empty grid.
     def __init__(self):
         # Keep track of the coordinates of all rock tiles.
         self.rocks = set()
         # The position where the sand is dropped from.
         self.sandSourcePos = Position(500, 0)
-        # When true, all positions with coordinate y == self.floorY are
-        # considered to be rock.
-        self.hasFloor = False
-        # The y coordinate of the floor.
+        # The y coordinate of the floor, if any.
         self.floorY = 0
         # Keep track of the minimum and the maximum x and y coordinates. This
         # essentially store the two corner of the smallest square that can hold
         # all the rocks. This is used to compute the positions that are
         # considered out of bounds and by extension which positions are
         # considered in the abyss.
-        self.min = copy.copy(self.sandSourcePos)
-        self.max = copy.copy(self.sandSourcePos)
+        self.min = self.sandSourcePos
+        self.max = self.sandSourcePos
 
-    # Check if a given position is rock or not.
-    def isRock(self, pos):
-        return (self.hasFloor and pos.y == self.floorY) or pos in self.rocks
+    # Check if a given position is rock or not. When `hasFloor` is True, all
+    # positions with coordinate y == self.floorY are considered to be rock.
+    def isRock(self, pos, hasFloor):
+        return (hasFloor and pos.y == self.floorY) or pos in self.rocks
 
     # Return true if the position `pos` is outside the boundaries, such tiles
     # will always fall into the abyss.
-    # If the grid has a floor then no tile can be out of bounds.
+    # This is only meaningful if the grid has no floor.
     def outOfBounds(self, pos):
-        return not self.hasFloor and \
-               not (self.min.x <= pos.x <= self.max.x and \
+        return not (self.min.x <= pos.x <= self.max.x and \
                     self.min.y <= pos.y <= self.max.y)
 
     # Add a path of rock to the grid. vertices is a list of Positions containing
@@ -63,10 +50,12 @@ class Grid:
             # Make sure the grid is big enough to insert the point, add air cells
             # if this is not the case
             self.rocks.add(pos)
-            self.min.x = min(self.min.x, pos.x)
-            self.min.y = min(self.min.y, pos.y)
-            self.max.x = max(self.max.x, pos.x)
-            self.max.y = max(self.max.y, pos.y)
+            if pos.x < self.min.x or pos.y < self.min.y:
+                self.min = Position(min(self.min.x, pos.x),
+                                    min(self.min.y, pos.y))
+            if pos.x > self.max.x or pos.y > self.max.y:
+                self.max = Position(max(self.max.x, pos.x),
+                                    max(self.max.y, pos.y))
             self.floorY = self.max.y + 2
 
         # Add a line of rock starting at start and ending at end. startPos and
@@ -92,8 +81,9 @@ class Grid:
     # units of sand that reached a resting state before hitting the termination
     # condition. terminationFunc is a function taking a position as its sole
     # argument and returns True if the position satisfies the termination
-    # condition, False otherwise.
-    def dfs(self, terminationFunc):
+    # condition, False otherwise. `hasFloor` indicates if the grid has a floor.
+    # The grid itself is not modified.
+    def dfs(self, terminationFunc, hasFloor):
         # Visited set and stack to implement DFS. Start with the position of the
         # source of sand.
         visited = set()
@@ -134,7 +124,7 @@ class Grid:
             leftDown = Position(tile.x - 1, tile.y + 1)
             rightDown = Position(tile.x + 1, tile.y + 1)
             for p in [rightDown, leftDown, down]:
-                if not self.isRock(p) and p not in visited:
+                if not self.isRock(p, hasFloor) and p not in visited:
                     # Record from which tile `p` was reached.
                     parent[p] = tile
                     visited.add(p)
@@ -147,16 +137,14 @@ class Grid:
     # is no floor, and return the number of units of sand coming to rest before
     # the sand starts falling into the abyss.
     def runPart1(self):
-        numDrops = self.dfs(self.outOfBounds)
+        numDrops = self.dfs(self.outOfBounds, False)
         return numDrops
 
     # Run the simulation of sand falling from the sand source. Assume that
     # there is a floor, and return the number of units of sand coming to rest
     # before the source gets blocked.
     def runPart2(self):
-        self.hasFloor = True
-        numDrops = self.dfs(lambda _: False)
-        self.hasFloor = False
+        numDrops = self.dfs(lambda _: False, True)
         return numDrops
 
 # Parse the input file and returns a Grid.
@@ -174,15 +162,11 @@ def parseInput(inputFile):
     fd.close()
     return grid
 
-def part1(inputFile):
-    grid = parseInput(inputFile)
+def part1(grid):
     return grid.runPart1()
 
-def part2(inputFile):
-    grid = parseInput(inputFile)
+def part2(grid):
     return grid.runPart2()
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
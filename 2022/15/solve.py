@@ -1,28 +1,15 @@
 #!/usr/bin/env python
 
-import sys
-import copy
 import re
 import math
 
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
-
-    # Compute the Manhattan distance between this point and other.
-    def dist(self, other):
-        return abs(self.x - other.x) + abs(self.y - other.y)
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
 
 # Class holding information about a sensor.
 class Sensor:
@@ -30,13 +17,13 @@ class Sensor:
     # beacon that is nearest to this sensor, as indicated in the input file.
     def __init__(self, pos, nearestBeacon):
         # The position of the sensor.
-        self.pos = copy.copy(pos)
+        self.pos = pos
         # The position of the nearest beacon.
-        self.beacon = copy.copy(nearestBeacon)
+        self.beacon = nearestBeacon
         # The manhattan distance between the sensor and its nearest beacon. This
         # indicates the radius around the sensor in which there cannot be a
         # beacon.
-        self.dist = pos.dist(nearestBeacon)
+        self.dist = pos.manhattan(nearestBeacon)
 
     def __repr__(self):
         return "Sensor, pos = {}, dist = {}".format(self.pos, self.dist)
@@ -52,10 +39,9 @@ def parseInput(inputFile):
         beaconPos = Position(coords[2], coords[3])
         sensors.add(Sensor(sensorPos, beaconPos))
     fd.close()
-    return sensors
+    return frozenset(sensors)
 
-def part1(inputFile):
-    sensors = parseInput(inputFile)
+def part1(sensors):
     Y = 2000000
     Xs = set()
     # Solve for x the eq |x - s.pos.x| + |Y - s.pos.y| = s.dist. Add all such x
@@ -69,9 +55,7 @@ def part1(inputFile):
 
     return len(Xs)
 
-def part2(inputFile):
-    sensors = parseInput(inputFile)
-
+def part2(sensors):
     # We know that there is only one position p so that for all sensor si,
     # dist(p, si.pos) > si.dist.
     # Also, because there is only a single such p, this position must be
@@ -129,7 +113,7 @@ def part2(inputFile):
 
     def findSensorForPos(pos):
         for s in sensors:
-            if pos.dist(s.pos) <= s.dist:
+            if pos.manhattan(s.pos) <= s.dist:
                 return s
         return None
 
@@ -139,6 +123,4 @@ def part2(inputFile):
     assert False
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,11 +1,17 @@
 #!/usr/bin/env python
 
-import sys
 import re
 import copy
-import cProfile
 import itertools
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.instrument import phase
+
 class Valve:
     def __init__(self, name, rate):
         self.name = name
@@ -74,8 +80,9 @@ def parseInput(inputFile):
     # computation won't work since it assumes that all paths between valves are
     # length 1 (thus uses BFS instead of Dijikstra).
     dists = []
-    for v in valves:
-        dists.append(computeShortestPaths(v))
+    with phase("shortest paths"):
+        for v in valves:
+            dists.append(computeShortestPaths(v))
     for i in range(len(valves)):
         valves[i].next = dists[i]
 
@@ -91,14 +98,16 @@ def parseInput(inputFile):
 
 # Compute the maximum pressure that can be released when starting at valve
 # `startValve` under `timeLimit` minutes.
-maxPressureCache = {}
+# `cache` is a dict memoizing the results, it is owned by the caller so that
+# part1 and part2 don't share any state.
 def maxPressureKey(valves, startValves, timeLimit):
     return (valves, startValves, timeLimit)
 
-def maxPressure(valves, startValve, timeLimit):
+@phase("search")
+def maxPressure(valves, startValve, timeLimit, cache):
     K = maxPressureKey(valves, startValve, timeLimit)
-    if K in maxPressureCache.keys():
-        return maxPressureCache[K]
+    if K in cache.keys():
+        return cache[K]
 
     class State:
         def __init__(self):
@@ -250,13 +259,12 @@ def maxPressure(valves, startValve, timeLimit):
         nextStates.sort(key=lambda s: s.score())
         for n in nextStates:
             S.insert(0, n)
-    maxPressureCache[K] = maxRelease
+    cache[K] = maxRelease
     return maxRelease
 
-def part1(inputFile):
-    valves = parseInput(inputFile)
+def part1(valves):
     startValve = list(filter(lambda v: v.name == "AA", valves))[0]
-    return maxPressure(valves, startValve, 30)
+    return maxPressure(valves, startValve, 30, {})
 
 def subsets(valves, length):
     if length == 1:
@@ -272,6 +280,7 @@ def subsets(valves, length):
                 res.append(set([first]) | s)
         return res
 
+@phase("subset graphs")
 def valvesForSubset(sub):
     res = [Valve(v.name, v.rate) for v in sub]
     nameToValve = {}
@@ -282,8 +291,8 @@ def valvesForSubset(sub):
         cpy.next = [(nameToValve[n.name], d) for n, d in v.next if n in sub]
     return frozenset(res)
 
-def part2(inputFile):
-    valves = parseInput(inputFile)
+def part2(valves):
+    cache = {}
     startValve = list(filter(lambda v: v.name == "AA", valves))[0]
     otherValves = list(filter(lambda v: v.name != "AA", valves))
     num = 0
@@ -301,15 +310,13 @@ def part2(inputFile):
             complement = valvesForSubset(complement)
 
             start = list(filter(lambda v: v.name == "AA", subset))[0]
-            bestSubset = maxPressure(subset, start, 26)
+            bestSubset = maxPressure(subset, start, 26, cache)
             start = list(filter(lambda v: v.name == "AA", complement))[0]
-            bestComplement = maxPressure(complement, start, 26)
+            bestComplement = maxPressure(complement, start, 26, cache)
 
             curr = bestSubset + bestComplement
             maxRelease = max(maxRelease, curr)
     return maxRelease
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
-import sys
-import copy
 import math
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
+
 class JetPattern:
     # `pattern` is a string containing the entire pattern.
     def __init__(self, pattern):
@@ -22,21 +28,6 @@ class Shape:
         self.width = len(mask[0])
         self.height = len(mask)
 
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
-
 class Grid:
     def __init__(self, jetPattern):
         self.width = 7
@@ -61,7 +52,7 @@ class Grid:
         # of its bottom left corner.
         startPos = Position(2, self.maxHeight() + 3) 
         # The current position of the shape.
-        currPos = copy.copy(startPos)
+        currPos = startPos
         # Add enough row to avoid out of bounds issues.
         if self.height <= currPos.y + shape.height:
             self.newRows(currPos.y + shape.height - self.height);
@@ -114,13 +105,14 @@ class Grid:
         return res
 
 
-# Parse the file and returns a JetPattern.
+# Parse the file and returns the jet pattern as a string. Each part creates its
+# own JetPattern from it.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
     lines = list(map(lambda l: l.replace("\n",""), fd.readlines()))
     fd.close()
     s = "".join(lines)
-    return JetPattern(s)
+    return s
 
 SHAPES = [
     Shape([[True] * 4]),
@@ -139,19 +131,18 @@ SHAPES = [
            [True, True]]),
 ]
 
-def part1(inputFile):
-    jp = parseInput(inputFile)
+def part1(pattern):
+    jp = JetPattern(pattern)
     grid = Grid(jp)
     for i in range(2022):
         s = SHAPES[i % len(SHAPES)]
         grid.dropShape(s)
     return grid.maxHeight() - 1
 
-def part2(inputFile):
-    inputLen = len(parseInput(inputFile).pattern)
+def part2(pattern):
     totalNumRocks = 1000000000000
 
-    jp = parseInput(inputFile)
+    jp = JetPattern(pattern)
     grid = Grid(jp)
 
     # Number of rocks dropped so far.
@@ -222,9 +213,7 @@ def part2(inputFile):
     return res
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
 
 #130:    |.......|
 #129:    |.......|
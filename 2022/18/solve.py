@@ -1,53 +1,41 @@
 #!/usr/bin/env python
 
-import sys
 import re
 
-# A position (x, y, z) in the 3D space.
-class Position:
-    def __init__(self, x, y, z):
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y and self.z == other.z
-
-    def __hash__(self):
-        return hash((self.x, self.y, self.z))
-
-    def __repr__(self):
-        return str((self.x, self.y, self.z))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position3d
 
 # Return list of 3D position.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
     p = fd.readlines()
     p = list(map(lambda l: re.findall("[0-9]+", l), p))
-    p = list(map(lambda c: Position(int(c[0]), int(c[1]), int(c[2])), p))
+    p = tuple(map(lambda c: Position3d(int(c[0]), int(c[1]), int(c[2])), p))
     fd.close()
     return p
 
-def part1(inputFile):
-    cubes = parseInput(inputFile)
+def part1(cubes):
     area = 0
     for c in cubes:
         neighbours = [
-            Position(c.x+1, c.y, c.z),
-            Position(c.x-1, c.y, c.z),
-            Position(c.x, c.y+1, c.z),
-            Position(c.x, c.y-1, c.z),
-            Position(c.x, c.y, c.z+1),
-            Position(c.x, c.y, c.z-1),
+            Position3d(c.x+1, c.y, c.z),
+            Position3d(c.x-1, c.y, c.z),
+            Position3d(c.x, c.y+1, c.z),
+            Position3d(c.x, c.y-1, c.z),
+            Position3d(c.x, c.y, c.z+1),
+            Position3d(c.x, c.y, c.z-1),
         ]
         for n in neighbours:
             if n not in cubes:
                 area += 1
     return area
 
-def part2(inputFile):
-    cubes = parseInput(inputFile)
-
+def part2(cubes):
     maxX = max([p.x for p in cubes]) + 1
     minX = min([p.x for p in cubes]) - 1
     maxY = max([p.y for p in cubes]) + 1
@@ -58,7 +46,7 @@ def part2(inputFile):
     def inBounds(p):
         return minX <= p.x <= maxX and minY <= p.y <= maxY and minZ <= p.z <= maxZ
 
-    root = Position(maxX, maxY, maxZ)
+    root = Position3d(maxX, maxY, maxZ)
     reachable = set()
     area = 0
 
@@ -70,12 +58,12 @@ def part2(inputFile):
 
         c = curr
         neighbours = [
-            Position(c.x+1, c.y, c.z),
-            Position(c.x-1, c.y, c.z),
-            Position(c.x, c.y+1, c.z),
-            Position(c.x, c.y-1, c.z),
-            Position(c.x, c.y, c.z+1),
-            Position(c.x, c.y, c.z-1),
+            Position3d(c.x+1, c.y, c.z),
+            Position3d(c.x-1, c.y, c.z),
+            Position3d(c.x, c.y+1, c.z),
+            Position3d(c.x, c.y-1, c.z),
+            Position3d(c.x, c.y, c.z+1),
+            Position3d(c.x, c.y, c.z-1),
         ]
         neighbours = list(filter(lambda n: inBounds(n) and n not in visited, neighbours))
         for n in neighbours:
@@ -88,6 +76,4 @@ def part2(inputFile):
     return area
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
-import sys
 import re
 import copy
-import cProfile
+
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.instrument import phase
 
 # Represents the cost of buying a robot in number of ore, clay and obsi
 class Cost:
@@ -24,6 +30,7 @@ class Blueprint:
 
     # Compute the maximum number of geodes that can be opened in INIT_TIME
     # minutes.
+    @phase("search")
     def maxOpenedGeodes(self, INIT_TIME):
         # Represent a state node.
         class State:
@@ -209,10 +216,9 @@ def parseInput(inputFile):
         geoRCost = Cost(nums[5], 0, nums[6])
         blueprints.append(Blueprint(oreRCost, clayRCost, obsiRCost, geoRCost))
     fd.close()
-    return blueprints
+    return tuple(blueprints)
 
-def part1(inputFile):
-    blueprints = parseInput(inputFile)
+def part1(blueprints):
     res = 0
     for i, b in enumerate(blueprints):
         m = b.maxOpenedGeodes(24)
@@ -221,8 +227,7 @@ def part1(inputFile):
         res += qlvl
     return res
 
-def part2(inputFile):
-    blueprints = parseInput(inputFile)
+def part2(blueprints):
     res = 1
     for i, b in enumerate(blueprints[:3]):
         m = b.maxOpenedGeodes(32)
@@ -231,6 +236,4 @@ def part2(inputFile):
     return res
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
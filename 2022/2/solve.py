@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
 # rock = 0
 # paper = 1
@@ -15,43 +20,52 @@ def outcome(h1, h2):
     else:
         return 1
 
-def part1(inputFile):
-    fd = open(inputFile, "r")
-    lines = fd.readlines()
-
-    totalScore = 0
-    for l in lines:
-        hands = l.replace("\n","").split(" ")
-        oppoHand = ord(hands[0]) - ord("A")
-        myHand = ord(hands[1]) - ord("X")
-
-        result = outcome(oppoHand, myHand)
-        # Map [-1;1] to [0;6]
-        totalScore += (result + 1) * 3
-        totalScore += myHand + 1
-
-    return totalScore
-
-def part2(inputFile):
-    fd = open(inputFile, "r")
-    lines = fd.readlines()
-
-    totalScore = 0
-    for l in lines:
-        parts = l.replace("\n","").split(" ")
-        oppoHand = ord(parts[0]) - ord("A")
-        # neededOutcome:
-        #   -1 if oppo needs to win
-        #   0 if draw
-        #   1 if need to win
-        neededOutcome = ord(parts[1]) - ord("X") - 1
-        neededHand = (oppoHand + neededOutcome) % 3
-        totalScore += (neededOutcome + 1) * 3
-        totalScore += neededHand + 1
-
-    return totalScore
+# Score of a round for part 1, where x is the hand played.
+def scorePart1(oppoHand, myHand):
+    result = outcome(oppoHand, myHand)
+    # Map [-1;1] to [0;6]
+    return (result + 1) * 3 + myHand + 1
+
+# Score of a round for part 2, where column is the needed outcome.
+def scorePart2(oppoHand, column):
+    # neededOutcome:
+    #   -1 if oppo needs to win
+    #   0 if draw
+    #   1 if need to win
+    neededOutcome = column - 1
+    neededHand = (oppoHand + neededOutcome) % 3
+    return (neededOutcome + 1) * 3 + neededHand + 1
+
+# There are only 9 different rounds, the score of each of them is precomputed.
+# SCORES[a][x] is the score of the round "a x", a and x mapped to [0;2].
+SCORES1 = tuple(tuple(scorePart1(a, x) for x in range(3)) for a in range(3))
+SCORES2 = tuple(tuple(scorePart2(a, x) for x in range(3)) for a in range(3))
+
+# Parse the input file and return a 3x3 tuple of the number of rounds for each
+# pair (a, x) where a is the opponent's column and x the second column of the
+# strategy guide, both mapped to [0;2].
+# Every line is one of 9 possible 4-byte records, each is counted with a single
+# bytes.count() over the whole file.
+def parseInput(inputFile):
+    fd = open(inputFile, "rb")
+    data = fd.read()
+    fd.close()
+    # Last line might not have a newline.
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    return tuple(tuple(data.count(bytes([ord("A") + a, ord(" "),
+                                         ord("X") + x, ord("\n")])) \
+                       for x in range(3)) for a in range(3))
+
+# Total score of the rounds, given the score of each of the 9 rounds.
+def totalScore(counts, scores):
+    return sum(counts[a][x] * scores[a][x] for a in range(3) for x in range(3))
+
+def part1(counts):
+    return totalScore(counts, SCORES1)
+
+def part2(counts):
+    return totalScore(counts, SCORES2)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,21 +1,27 @@
 #!/usr/bin/env python
 
-import sys
 import re
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
 def parseInput(inputFile):
     fd = open(inputFile, "r")
     nums = []
     for l in fd.readlines():
         nums.append(int(re.findall("-?[0-9]+", l)[0]))
-    return nums
+    fd.close()
+    return tuple(nums)
 
 # Find the response for part 1 and part 2. Set decryptionKey to 1 for part 1.
 # This is not very efficient, I'll prob go back to this in the future to find a
 # better solution (insert "... and other jokes you can tell yourself" meme
 # here).
-def find(inputFile, decryptionKey):
-    nums = parseInput(inputFile)
+def find(nums, decryptionKey):
     nums = list(map(lambda n: n * decryptionKey, nums))
     # Keep track of the original index of each number in the mixed list.
     indices = list(range(len(nums)))
@@ -42,13 +48,11 @@ def find(inputFile, decryptionKey):
     l = len(nums)
     return nums[(zeroIdx+1000)%l] + nums[(zeroIdx+2000)%l] + nums[(zeroIdx+3000)%l]
 
-def part1(inputFile):
-    return find(inputFile, 1)
+def part1(nums):
+    return find(nums, 1)
 
-def part2(inputFile):
-    return find(inputFile, 811589153)
+def part2(nums):
+    return find(nums, 811589153)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
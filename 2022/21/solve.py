@@ -1,10 +1,14 @@
 #!/usr/bin/env python
 
-import sys
 import re
 from enum import Enum
 
-PART2 = False
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
 # The trick here is to build an AST of the computation made by the `root`
 # monkey. For part 1 we simply evaluate the AST. For part 2 we solve for the
@@ -16,7 +20,8 @@ class Node:
         raise Exception("Abstract method Node.value()")
 
     # Resolve all references under this node and replace them with their
-    # corresponding AST. ctx is a dict mapping ref names to their AST.
+    # corresponding AST. ctx is a dict mapping ref names to their AST. A
+    # reference to "humn" is left unresolved if "humn" is not in ctx.
     def resolveRefs(self, ctx):
         raise Exception("Abstract method Node.resolveRefs()")
 
@@ -56,7 +61,7 @@ class RefNode(Node):
         raise Exception("Node.value() on RefNode")
 
     def resolveRefs(self, ctx):
-        if PART2 and self.name == "humn":
+        if self.name == "humn" and self.name not in ctx:
             return self
         else:
             return ctx[self.name].resolveRefs(ctx)
@@ -183,14 +188,14 @@ class DivNode(Node):
     def __repr__(self):
         return str("DIV({},{})".format(str(self.left), str(self.right)))
 
-def parseInput(inputFile, skipHuman):
+# Parse the input file and return a dict mapping each monkey's name to its
+# (unresolved) AST. The dict is not modified by part1 and part2.
+def parseInput(inputFile):
     fd = open(inputFile, "r")
     nodes = {}
     for l in fd.readlines():
         l = l.replace("\n", "")
         name = l[:4]
-        if skipHuman and name == "humn":
-            continue
         nums = re.findall("[0-9]+", l)
         if len(nums) > 0:
             # This is a ConstNode.
@@ -212,34 +217,23 @@ def parseInput(inputFile, skipHuman):
                 nodes[name] = DivNode(left, right)
 
     fd.close()
+    return nodes
 
-    if not skipHuman:
-        # Part 1.
-        root = nodes["root"]
-        root = root.resolveRefs(nodes)
-        return root
-    else:
-        # Part 2.
-        root = nodes["root"]
-        left = root.left.resolveRefs(nodes)
-        right = root.right.resolveRefs(nodes)
-        return (left, right)
-
-
-def part1(inputFile):
-    root = parseInput(inputFile, False)
+def part1(nodes):
+    root = nodes["root"]
+    root = root.resolveRefs(nodes)
     return root.value()
 
-def part2(inputFile):
-    global PART2
-    PART2 = True
-    left, right = parseInput(inputFile, True)
+def part2(nodes):
+    # Skip the human so that its references are left unresolved.
+    ctx = {name: n for name, n in nodes.items() if name != "humn"}
+    root = ctx["root"]
+    left = root.left.resolveRefs(ctx)
+    right = root.right.resolveRefs(ctx)
     if left.hasInput() and not right.hasInput():
         return left.solve(right)
     else:
         return right.solve(left)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
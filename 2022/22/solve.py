@@ -1,30 +1,15 @@
 #!/usr/bin/env python
 
-import sys
 from enum import Enum
 import re
 
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __add__(self, other):
-        return Position(self.x + other.x, self.y + other.y)
-
-    def __mul__(self, scalar):
-        assert type(scalar) == int
-        return Position(self.x * scalar, self.y * scalar)
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
 
 DIRS = [Position(1, 0), Position(0, 1), Position(-1, 0), Position(0, -1)]
 
@@ -295,15 +280,13 @@ def parseInput(inputFile):
     fd.close()
     return (board, path)
 
-def part1(inputFile):
-    board, path = parseInput(inputFile)
+def part1(data):
+    board, path = data
     return board.computePassword(path, False)
 
-def part2(inputFile):
-    board, path = parseInput(inputFile)
+def part2(data):
+    board, path = data
     return board.computePassword(path, True)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
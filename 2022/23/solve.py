@@ -1,41 +1,27 @@
 #!/usr/bin/env python
 
-import sys
-
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __add__(self, other):
-        return Position(self.x + other.x, self.y + other.y)
-
-    def __mul__(self, scalar):
-        assert type(scalar) == int
-        return Position(self.x * scalar, self.y * scalar)
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position
 
 North = Position(0, 1)
 South = Position(0, -1)
 West = Position(-1, 0)
 East = Position(1, 0)
-DirProposal = [
+# The initial order in which the directions are proposed. Each round rotates a
+# copy of this list.
+DIR_PROPOSAL = (
     (West + North, North, North + East),
     (West + South, South, South + East),
     (West + North, West, West + South),
     (East + North, East, East + South)
-]
+)
 
-# Parse the input, returs the list of elves positions.
+# Parse the input, returs the set of elves positions.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
     elves = []
@@ -49,10 +35,10 @@ def parseInput(inputFile):
         y += 1
 
     fd.close()
-    return elves
+    return frozenset(elves)
 
-def part1(inputFile):
-    elves = parseInput(inputFile)
+def part1(elves):
+    dirProposal = list(DIR_PROPOSAL)
     # Run the rounds.
     for _ in range(10):
         def propose(p):
@@ -66,7 +52,7 @@ def part1(inputFile):
             if not needProposal(p):
                 return (p, p)
             else:
-                for l, d, r in DirProposal:
+                for l, d, r in dirProposal:
                     if (l + p) not in elves and \
                        (d + p) not in elves and \
                        (r + p) not in elves:
@@ -79,7 +65,7 @@ def part1(inputFile):
             numProp[p[0]] = numProp.get(p[0], 0) + 1
         elves = {(p[0] if numProp[p[0]] == 1 else p[1]) for p in proposals}
 
-        DirProposal.append(DirProposal.pop(0))
+        dirProposal.append(dirProposal.pop(0))
 
     # Count the empty tiles.
     xMin = min([p.x for p in elves])
@@ -94,15 +80,8 @@ def part1(inputFile):
     return count
 
 
-def part2(inputFile):
-    global DirProposal
-    DirProposal = [
-        (West + North, North, North + East),
-        (West + South, South, South + East),
-        (West + North, West, West + South),
-        (East + North, East, East + South)
-    ]
-    elves = parseInput(inputFile)
+def part2(elves):
+    dirProposal = list(DIR_PROPOSAL)
     # Run the rounds.
     numRounds = 0
     done = False
@@ -120,7 +99,7 @@ def part2(inputFile):
             if not needProposal(p):
                 return (p, p)
             else:
-                for l, d, r in DirProposal:
+                for l, d, r in dirProposal:
                     if (l + p) not in elves and \
                        (d + p) not in elves and \
                        (r + p) not in elves:
@@ -143,11 +122,9 @@ def part2(inputFile):
                 return pair[1]
         elves = {getNextPos(p) for p in proposals}
 
-        DirProposal.append(DirProposal.pop(0))
+        dirProposal.append(dirProposal.pop(0))
 
     return numRounds
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,33 +1,16 @@
 #!/usr/bin/env python
 
-import sys
 import copy
 import math
 
-# A position (x, y) in the 2D grid.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __add__(self, other):
-        return Position(self.x + other.x, self.y + other.y)
-
-    def __sub__(self, other):
-        return Position(self.x - other.x, self.y - other.y)
-
-    def __mul__(self, scalar):
-        assert type(scalar) == int
-        return Position(self.x * scalar, self.y * scalar)
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __repr__(self):
-        return str((self.x, self.y))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.instrument import phase
+from aoc.position import Position
 
 CHARTODIR = {
     ">": Position(1, 0),
@@ -65,6 +48,7 @@ class Valley:
         self.blizzardsMask = []
         self.__precomputeBlizzardsPos()
 
+    @phase("precompute blizzards")
     def __precomputeBlizzardsPos(self):
         # The positions occupied by the blizzards repeat itself every [w-2,h-2]
         # minutes.
@@ -114,10 +98,13 @@ def parseInput(inputFile):
     blizzards = frozenset(blizzards)
     return Valley(width, height, startPos, exitPos, blizzards)
 
-def findShortestPath(valley, startTime):
+# Find the shortest path from `startPos` to `exitPos`, leaving `startPos` at
+# `startTime`. The valley is not modified.
+@phase("search")
+def findShortestPath(valley, startPos, exitPos, startTime):
     # Check if a Position is within the bounds of the valley.
     def posInBounds(p):
-        return p == valley.startPos or p == valley.exitPos or \
+        return p == startPos or p == exitPos or \
                (1 <= p.x <= valley.width - 2 and 1 <= p.y <= valley.height - 2)
 
     class State:
@@ -157,13 +144,13 @@ def findShortestPath(valley, startTime):
                     nextStates.append(s)
             return nextStates
 
-    startState = State(valley.startPos)
+    startState = State(startPos)
 
     todo = [startState]
     minPath = 999999
 
     def h(s):
-        return abs(s.exPos.x - valley.exitPos.x) + abs(s.exPos.y - valley.exitPos.y)
+        return abs(s.exPos.x - exitPos.x) + abs(s.exPos.y - exitPos.y)
 
     DEF_SCORE = 999999
     gScores = {startState: 0}
@@ -179,7 +166,7 @@ def findShortestPath(valley, startTime):
         assert not valley.posInBlizzard(curr.exPos, curr.numSteps)
 
         #print(f"{curr.exPos} -> {curr.numSteps}")
-        if curr.exPos == valley.exitPos:
+        if curr.exPos == exitPos:
             minPath = min(minPath, curr.numSteps)
             continue
         elif minPath < curr.numSteps + h(curr):
@@ -204,27 +191,17 @@ def findShortestPath(valley, startTime):
             todo.insert(i, s)
     return minPath
 
-def part1(inputFile):
-    valley = parseInput(inputFile)
-    return findShortestPath(valley, 0)
+def part1(valley):
+    return findShortestPath(valley, valley.startPos, valley.exitPos, 0)
 
-def part2(inputFile):
-    valley = parseInput(inputFile)
+def part2(valley):
     # Go to the exit
-    toExit = findShortestPath(valley, 0)
+    toExit = findShortestPath(valley, valley.startPos, valley.exitPos, 0)
     # Now go back for the snack, need to swap the start and end positions.
-    tmp = valley.startPos
-    valley.startPos = valley.exitPos
-    valley.exitPos = tmp
-    backToStart = findShortestPath(valley, toExit)
+    backToStart = findShortestPath(valley, valley.exitPos, valley.startPos, toExit)
     # Now go back to the exit
-    tmp = valley.startPos
-    valley.startPos = valley.exitPos
-    valley.exitPos = tmp
-    backToExit = findShortestPath(valley, backToStart)
+    backToExit = findShortestPath(valley, valley.startPos, valley.exitPos, backToStart)
     return backToExit
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
 # Return the list of number in SNAFU format.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
     lines = fd.readlines()
     fd.close()
-    return list(map(lambda l: l.replace("\n", ""), lines))
+    return tuple(map(lambda l: l.replace("\n", ""), lines))
 
 # Converts a SNAFU digit to its base 10 equivalent.
 snafuDigitToBase10 = {
@@ -62,14 +67,11 @@ def toSnafu(dNum):
     digits.sort(key=lambda i: -i[0])
     return "".join([base10DigitToSnafu[e[1]] for e in digits])
 
-def part1(inputFile):
-    nums = parseInput(inputFile)
+def part1(nums):
     return toSnafu(sum([toDec(n) for n in nums]))
 
-def part2(inputFile):
+def part2(nums):
     return 0
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,43 +1,48 @@
 #!/usr/bin/env python
 
-import sys
-
-def getDuplicateItemType(sackContent):
-    # For a sack's content, compute the type of item that appear in both
-    # compartments.
-    l = len(sackContent)
-    h = l//2
-    firstCompartment = set(sackContent[:h])
-    secondCompartment = set(sackContent[h:])
-    inter = firstCompartment.intersection(secondCompartment)
-    assert len(inter) == 1
-    # Get first and only element of the set.
-    return next(iter(inter))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
 def getPriorityForItemType(t):
     # For an item type t = [a-z][A-Z], compute its numerical priority.
     return (ord(t) - ord('A') + 27) if ord(t) <= ord('Z') else (ord(t) - ord('a') + 1)
 
-def part1(inputFile):
-    fd = open(inputFile, "r")
-    lines = fd.readlines()
-    commonTypes = list(map(lambda l: getDuplicateItemType(l.replace("\n","")), lines))
-    priorities = list(map(lambda l: getPriorityForItemType(l), commonTypes))
-    return sum(priorities)
+# Sets of item types are 52-bit masks in which the bit `priority - 1` is set for
+# each type in the set. Intersections are `&` and the priority of the single
+# type of a mask is its bit_length().
+ITEM_BIT = {t: 1 << (getPriorityForItemType(t) - 1) \
+            for t in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"}
 
-def part2(inputFile):
+# Parse the input file and return a tuple containing, for each sack, the pair
+# of masks of the item types in its first and second compartments.
+def parseInput(inputFile):
     fd = open(inputFile, "r")
-    lines = fd.readlines();
-    lines = list(map(lambda l: l.replace("\n", ""), lines))
-    groupSacks = [lines[i*3:(i+1)*3] for i in range(len(lines) // 3)]
-    # Compute the common item in the sacks of a given group.
-    common = lambda s: set(s[0]).intersection(set(s[1])).intersection(set(s[2]))
-    groupCommon = list(map(common, groupSacks))
-    # Get the only element from the set
-    groupCommon = list(map(lambda s: next(iter(s)), groupCommon))
-    return sum(map(lambda t: getPriorityForItemType(t), groupCommon))
+    sacks = []
+    for l in fd.read().split():
+        h = len(l) // 2
+        first = 0
+        for t in set(l[:h]):
+            first |= ITEM_BIT[t]
+        second = 0
+        for t in set(l[h:]):
+            second |= ITEM_BIT[t]
+        sacks.append((first, second))
+    fd.close()
+    return tuple(sacks)
+
+def part1(sacks):
+    # The only type that appears in both compartments.
+    return sum((first & second).bit_length() for first, second in sacks)
+
+def part2(sacks):
+    sackMasks = [first | second for first, second in sacks]
+    # The only type common to the three sacks of each group.
+    return sum((a & b & c).bit_length() for a, b, c in \
+               zip(sackMasks[0::3], sackMasks[1::3], sackMasks[2::3]))
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
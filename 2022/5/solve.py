@@ -1,16 +1,26 @@
 #!/usr/bin/env python
 
-import sys
+import os
+
+if not __package__:
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
+# If $AOC_CROSS_CHECK is set, each part is also solved by moving all the crates
+# and both answers are compared. This is slow on big inputs, hence opt-in.
+CROSS_CHECK = os.environ.get("AOC_CROSS_CHECK") is not None
 
 def parseInput(inputFile):
     # Parse the entire input file and returns a pair where the first element is
-    # the stacks configuration (a dict. int -> list of str) and the second is
-    # the procedure (e.g. list of moves).
-    # The list in the stacks configuration represent the content of a given
-    # stack where index 0 is the _bottom_ crate of the stack.
-    # The list of moves is a list of tuple of the form (N, src, dst) indicating
-    # that N crates should be moved from stack with id `src` to stack with id
-    # `dst`.
+    # the stacks configuration (a tuple of tuple of str) and the second is the
+    # procedure (e.g. tuple of moves).
+    # stacks[i] represents the content of the stack with id i+1 where index 0
+    # is the _bottom_ crate of the stack.
+    # The moves are tuples of the form (N, src, dst) indicating that N crates
+    # should be moved from stack with id `src` to stack with id `dst`.
+    # Both are read-only, part1 and part2 work on their own copy of the stacks.
 
     fd = open(inputFile, "r")
     lines = fd.readlines()
@@ -18,19 +28,10 @@ def parseInput(inputFile):
     # The stacks configuration
     stacks = {}
 
-    def addToBottomOfStack(stackId, elem):
-        # Add an element to the bottom of the stack. stackId must be >= 1, elem
-        # is the str/char of the crate to be added to the stack.
-        if not stackId in stacks.keys():
-            # First time we are seeing this stack, create it.
-            stacks[stackId] = [elem]
-        else:
-            stacks[stackId] = [elem] + stacks[stackId]
-    
-    # Parse the stacks initial configuration from top to bottom, hence why we
-    # add at the bottom of the stacks at each step.
+    # Parse the stacks initial configuration from bottom to top, so that each
+    # crate is pushed on top of its stack.
     stackConfig = list(filter(lambda l: "[" in l, lines))
-    for row in stackConfig:
+    for row in reversed(stackConfig):
         # We can use the index of the A-Z chars in the line/row to compute which
         # stack they belong to. For stack id 1, the chars are in col/index 1,
         # for stack 2 the index is 5, for stack 3 it is 9, ...
@@ -42,7 +43,10 @@ def parseInput(inputFile):
         for i, crate in enumerate(crates):
             if crate != " ":
                 stackId = i + 1
-                addToBottomOfStack(stackId, crate)
+                if not stackId in stacks.keys():
+                    # First time we are seeing this stack, create it.
+                    stacks[stackId] = []
+                stacks[stackId].append(crate)
 
     # Stacks initial configuration parsing done, parse the list of moves.
     # +2 because we need to take the line with the stack ids and the blank line
@@ -53,8 +57,10 @@ def parseInput(inputFile):
         # from X to Y". Returns the tuple (N,X,Y).
         parts = l.replace("\n", "").split(" ")
         return (int(parts[1]), int(parts[3]), int(parts[5]))
-    moves = list(map(lambda l: parseMove(l), moves))
-    
+    moves = tuple(map(lambda l: parseMove(l), moves))
+
+    fd.close()
+    stacks = tuple(tuple(stacks[i+1]) for i in range(len(stacks.keys())))
     return (stacks, moves)
 
 def applyMoves(stacks, moves, canMoveMultiple):
@@ -71,35 +77,84 @@ def applyMoves(stacks, moves, canMoveMultiple):
         #   - the same order if canMoveMultiple == True
         #   - in reverse order if canMoveMultiple == False
         assert src in stacks.keys() and dst in stacks.keys()
-        # The top N crates from src.
-        topN = stacks[src][-N:]
-        # Remove the top N crates from src.
-        stacks[src] = stacks[src][:-N]
-        # Add the N crates in reverse order to dst.
-        if not canMoveMultiple:
-            topN.reverse()
-        stacks[dst] += topN
+        srcStack = stacks[src]
+        # Only the top N crates are copied, the rest of `src` stays in place.
+        if canMoveMultiple:
+            stacks[dst].extend(srcStack[-N:])
+        else:
+            stacks[dst].extend(reversed(srcStack[-N:]))
+        del srcStack[-N:]
 
     for m in moves:
         applyMove(m)
 
-def part1(inputFile):
-    stacks, moves = parseInput(inputFile)
-    # Apply all the moves on the stacks configuration.
-    applyMoves(stacks, moves, False)
-    # Compute the result by concatenating the top of each stack.
+def topCratesAfterMoves(stacks, moves, canMoveMultiple):
+    # Apply all the moves on a copy of the stacks configuration and compute the
+    # result by concatenating the top of each stack.
+    stacks = {i+1: list(s) for i, s in enumerate(stacks)}
+    applyMoves(stacks, moves, canMoveMultiple)
     numStacks = len(stacks.keys())
     return "".join([stacks[i+1][-1] for i in range(numStacks)])
 
-def part2(inputFile):
-    stacks, moves = parseInput(inputFile)
-    # Apply all the moves on the stacks configuration.
-    applyMoves(stacks, moves, True)
-    # Compute the result by concatenating the top of each stack.
-    numStacks = len(stacks.keys())
-    return "".join([stacks[i+1][-1] for i in range(numStacks)])
+def topCratesReplay(stacks, moves, canMoveMultiple):
+    # Same as topCratesAfterMoves but without moving any crate: the slot of the
+    # top crate of each stack is traced backwards through the moves to find the
+    # slot it started from. Runs in O(moves * stacks) whatever the number of
+    # crates in the stacks and in the moves.
+    numStacks = len(stacks)
+    # Only the number of crates of each stack is simulated forward.
+    sizes = [len(s) for s in stacks]
+    for N, src, dst in moves:
+        sizes[src-1] -= N
+        sizes[dst-1] += N
+    res = []
+    for i in range(numStacks):
+        if sizes[i] == 0:
+            # No crate on top of an empty stack.
+            continue
+        # Slot of the crate as (stack id, depth), the depth counting from the
+        # top of the stack, e.g. 0 is the top crate.
+        stackId, depth = i + 1, 0
+        for N, src, dst in reversed(moves):
+            if src == dst:
+                # Moving crates onto their own stack leaves it unchanged, as in
+                # applyMoves.
+                continue
+            if stackId == dst:
+                if depth < N:
+                    # The crate was moved by this move, it was in the top N
+                    # crates of src.
+                    stackId = src
+                    if not canMoveMultiple:
+                        # The crates were moved one by one, reversing them.
+                        depth = N - 1 - depth
+                else:
+                    depth -= N
+            elif stackId == src:
+                # The N crates moved away were on top of it.
+                depth += N
+        res.append(stacks[stackId-1][-1 - depth])
+    return "".join(res)
+
+# Check the answer `res` of topCratesReplay against the forward simulation.
+def crossCheck(res, stacks, moves, canMoveMultiple):
+    expected = topCratesAfterMoves(stacks, moves, canMoveMultiple)
+    if res != expected:
+        raise Exception("Replay found {} instead of {}".format(res, expected))
+
+def part1(data):
+    stacks, moves = data
+    res = topCratesReplay(stacks, moves, False)
+    if CROSS_CHECK:
+        crossCheck(res, stacks, moves, False)
+    return res
+
+def part2(data):
+    stacks, moves = data
+    res = topCratesReplay(stacks, moves, True)
+    if CROSS_CHECK:
+        crossCheck(res, stacks, moves, True)
+    return res
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -2,48 +2,105 @@
 
 import sys
 
-def readStream(inputFile):
-    return open(inputFile, "r").readlines()[0].replace("\n", "")
+if not __package__:
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
+# Length of the start-of-packet and start-of-message markers.
+PACKET_MARKER_LEN = 4
+MESSAGE_MARKER_LEN = 14
+
+# Size of the chunks in which the input is read.
+CHUNK_SIZE = 1 << 20
+
+# Find the first marker (e.g. sequence of distinct chars) of several lengths in
+# a stream fed one chunk at a time.
+# The window is the longest sequence of distinct chars ending at the current
+# char. When a char enters the window, the window is cut right after the
+# previous occurrence of that char, if it is in the window. A marker of length k
+# ends at the first char for which the window is at least k chars long, hence a
+# single window answers all the lengths.
+# The window is only described by the index of its first char and the index of
+# the last occurrence of each char, so nothing of the previous chunks has to be
+# kept to process the next one.
+class MarkerDetector:
+    def __init__(self, markerLens):
+        # Maps each length to the index of the beginning of the message after
+        # the marker, 0 if no such marker was found (yet).
+        self.markers = {k: 0 for k in markerLens}
+        self.pending = sorted(self.markers.keys())
+        # Index of the last occurrence of each byte value, -1 if not seen yet.
+        # Any char is accepted, not only a-z.
+        self.lastSeen = [-1] * 256
+        # Index of the first char of the window.
+        self.start = 0
+        # Number of chars fed so far.
+        self.length = 0
+
+    # True once the markers of all the lengths are found.
+    def done(self):
+        return len(self.pending) == 0
+
+    # Feed the next chunk of the stream, as bytes. Line breaks are ignored.
+    def feed(self, chunk):
+        codes = chunk.translate(None, b"\r\n")
+        pending = self.pending
+        lastSeen = self.lastSeen
+        start = self.start
+        for i, c in enumerate(codes, self.length):
+            if len(pending) == 0:
+                break
+            if lastSeen[c] >= start:
+                start = lastSeen[c] + 1
+            lastSeen[c] = i
+            while len(pending) and i - start + 1 >= pending[0]:
+                self.markers[pending.pop(0)] = i + 1
+        self.start = start
+        self.length += len(codes)
+
+def findMarkers(stream, markerLens):
+    # Read the stream and find the first marker of each of the lengths in
+    # `markerLens`.
+    # Return a dict mapping each length to the index of the beginning of the
+    # message after the marker, 0 if no such marker exists.
+    detector = MarkerDetector(markerLens)
+    detector.feed(stream.encode())
+    return detector.markers
 
 def findMarker(stream, markerLen):
-    # Read the stream and find the first marker (e.g. sequence of distinct
-    # chars) that is of length `markerLen` characters.
+    # Read the stream and find the first marker that is of length `markerLen`
+    # characters.
     # Return 0 if no such marker exists.
-    def isMarker(chars):
-        # Return True if the str chars is a marker, False otherwise.
-        return len(set(chars)) == markerLen
-
-    for i in range(len(stream) - markerLen + 1):
-        chars = stream[i:i+markerLen]
-        if isMarker(chars):
-            # This is a marker, we are done here.
-            return i + markerLen
-
-    # The puzzle does not seem to give a stream without a marker. So not really
-    # necessary here.
-    return 0
-
-def findPacketStartMarker(stream):
-    # Get the first packet start marker in the stream.
-    # Returns the index of the beginning of the message after the marker.
-    # Return 0 if no such marker exists.
-    return findMarker(stream, 4)
+    return findMarkers(stream, [markerLen])[markerLen]
 
-def findMessageStartMarker(stream):
-    # Get the first message start marker in the stream.
-    # Returns the index of the beginning of the message after the marker.
-    # Return 0 if no such marker exists.
-    return findMarker(stream, 14)
+# Parse the input file and return a dict mapping the length of the markers to
+# the index of the beginning of the message after the first marker of that
+# length, see MarkerDetector.
+# The file is read in chunks of CHUNK_SIZE bytes until all the markers are
+# found, the stream is never held in memory as a whole. "-" reads the stream
+# from stdin, which can be a pipe.
+def parseInput(inputFile):
+    if inputFile == "-":
+        fd = sys.stdin.buffer
+    else:
+        fd = open(inputFile, "rb")
+    detector = MarkerDetector([PACKET_MARKER_LEN, MESSAGE_MARKER_LEN])
+    while not detector.done():
+        chunk = fd.read(CHUNK_SIZE)
+        if len(chunk) == 0:
+            break
+        detector.feed(chunk)
+    if fd is not sys.stdin.buffer:
+        fd.close()
+    return detector.markers
 
-def part1(inputFile):
-    stream = readStream(inputFile)
-    return findPacketStartMarker(stream)
+def part1(markers):
+    return markers[PACKET_MARKER_LEN]
 
-def part2(inputFile):
-    stream = readStream(inputFile)
-    return findMessageStartMarker(stream)
+def part2(markers):
+    return markers[MESSAGE_MARKER_LEN]
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
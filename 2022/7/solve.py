@@ -2,10 +2,18 @@
 
 # A rather overkill solution that is also nasty at the same time, go figure.
 
-import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from enum import Enum
 from abc import abstractmethod
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
 # A node of the filesystem tree.
 class Node:
     class Type(Enum):
@@ -22,17 +30,6 @@ class Node:
     def size(self):
         pass
 
-    # Compute answer to part 1 recursively.
-    @abstractmethod
-    def part1(self):
-        pass
-
-    # Compute answer to part 2 recursively. Returns a list of Directory Nodes
-    # for which their size is >= minSize.
-    @abstractmethod
-    def part2(self, minSize):
-        pass
-
 # Special type of node representing a file in the filesystem tree.
 class File(Node):
     def __init__(self, name, parent, size):
@@ -45,20 +42,35 @@ class File(Node):
     def print(self, nestLevel):
         print(" " * nestLevel + "{} {}".format(self._fileSize, self.name))
 
-    def part1(self):
-        return 0
-
-    def part2(self, minSize):
-        return []
-
 # Special type of node representing a directory in the filesystem tree.
 class Dir(Node):
     def __init__(self, name, parent):
         super().__init__(name, Node.Type.DIR, parent)
         self._children = {}
+        # Cached by computeSizes(), once the whole tree is known.
+        self._size = None
 
     def size(self):
-        return sum([c.size() for c in self._children.values()])
+        assert self._size is not None
+        return self._size
+
+    def dirs(self):
+        # Iterate over this directory and all the directories under it, parents
+        # first. Iterative, the tree can be deeper than the recursion limit.
+        stack = [self]
+        while len(stack) > 0:
+            d = stack.pop()
+            yield d
+            for c in d._children.values():
+                if c.nodeType == Node.Type.DIR:
+                    stack.append(c)
+
+    def computeSizes(self):
+        # Compute and cache the size of all the directories of the tree in a
+        # single post-order pass: going through the directories in the reverse
+        # order of dirs(), all the children are done before their parent.
+        for d in reversed(list(self.dirs())):
+            d._size = sum(c.size() for c in d._children.values())
 
     def child(self, childName):
         # Get a reference to a child from its name.
@@ -70,110 +82,137 @@ class Dir(Node):
         # The caller must make sure the parent backpointer is correct.
         assert child.parent == self
 
-    def part1(self):
-        res = 0
-        size = self.size()
-        if size <= 100000:
-            res += size
-        for c in self._children.keys():
-            res += self._children[c].part1()
-        return res
-
-    def part2(self, minSize):
-        res = []
-        if self.size() >= minSize:
-            res.append(self)
-        for c in self._children.keys():
-            res += self._children[c].part2(minSize)
-        return res
-
-def parseFilesystem(inputFile):
+# A flat index of the directories of a filesystem tree, answering queries on the
+# directory sizes without walking the Node objects.
+# The directories are numbered in the order of Dir.dirs(), the root being 0, and
+# described by columns:
+#   - names[i] is the name of directory i.
+#   - parents[i] is the index of the parent of directory i, -1 for the root.
+#   - sizes[i] is the total size of directory i, files in sub-directories
+#     included.
+# The directories are also kept sorted by size, with the prefix sums of their
+# sizes, so that the queries on sizes are a bisection. The queries return
+# directory indices, see pathOf().
+class FilesystemIndex:
+    def __init__(self, root):
+        self.root = root
+        self.names = []
+        self.parents = array("q")
+        self.sizes = array("q")
+        # Path of a directory, e.g. "/a/b", -> its index.
+        self.pathIndex = {}
+
+        # Index and path of the directories already visited. The parents are
+        # always visited before their children.
+        indexOf = {}
+        paths = []
+        for d in root.dirs():
+            if d.parent is None:
+                parent = -1
+                path = "/"
+            else:
+                parent = indexOf[id(d.parent)]
+                path = paths[parent].rstrip("/") + "/" + d.name
+            indexOf[id(d)] = len(paths)
+            paths.append(path)
+            self.pathIndex[path] = len(self.sizes)
+            self.names.append(d.name)
+            self.parents.append(parent)
+            self.sizes.append(d.size())
+
+        # bySize[j] is the index of the j-th smallest directory, and
+        # sortedSizes[j] its size.
+        self.bySize = array("q", sorted(range(len(self.sizes)),
+                                        key=self.sizes.__getitem__))
+        self.sortedSizes = array("q", (self.sizes[i] for i in self.bySize))
+        # prefixSums[i] is the sum of the i smallest sizes.
+        self.prefixSums = array("q", [0])
+        for size in self.sortedSizes:
+            self.prefixSums.append(self.prefixSums[-1] + size)
+
+    def __len__(self):
+        return len(self.sizes)
+
+    # Index of the directory at `path`, None if there is no such directory.
+    def indexOf(self, path):
+        return self.pathIndex.get(path.rstrip("/") or "/")
+
+    # Path of the directory of index `i`, rebuilt by going up its parents.
+    def pathOf(self, i):
+        names = []
+        while self.parents[i] >= 0:
+            names.append(self.names[i])
+            i = self.parents[i]
+        return "/" + "/".join(reversed(names))
+
+    # Size of the directory at `path`, None if there is no such directory.
+    def sizeOf(self, path):
+        i = self.indexOf(path)
+        return None if i is None else self.sizes[i]
+
+    # Indices of all the directories of size <= maxSize, by increasing size.
+    def dirsAtMost(self, maxSize):
+        return self.bySize[:bisect_right(self.sortedSizes, maxSize)]
+
+    # Sum of the sizes of all the directories of size <= maxSize.
+    def totalAtMost(self, maxSize):
+        return self.prefixSums[bisect_right(self.sortedSizes, maxSize)]
+
+    # Index of the smallest directory of size >= minSize, None if there is none.
+    def smallestAtLeast(self, minSize):
+        j = bisect_left(self.sortedSizes, minSize)
+        return self.bySize[j] if j < len(self.bySize) else None
+
+def parseInput(inputFile):
     # Compute the filesystem tree from the input file containing commands and
     # their outputs.
-    # Return a reference to the root directory (node) of the filesystem tree.
+    # Return the FilesystemIndex of the tree, its root directory (node) is
+    # `root`.
+    # The input is read one line at a time: the lines that are not commands are
+    # the output of the last `ls`, e.g. the content of the current directory.
     fd = open(inputFile, "r")
-    lines = list(map(lambda l: l.replace("\n", ""), fd.readlines()))
 
     # The current node.
     root = Dir("/", None)
     currNode = root
 
-    def parseCd(output):
-        # Parse a cd command and change cwd accordingly.
-        # `output` is the output of the command including the cmd line. In the
-        # case of cd this should only contains the cmdline itself.
-        assert len(output) == 1
-        cmd = output[0]
-        assert "$ cd" in cmd
-        dest = cmd.split(" ")[2]
-        nonlocal currNode
-        if dest == "/":
-            currNode = root
-        elif dest == "..":
-            # Go up a directory.
-            assert currNode.parent is not None
-            currNode = currNode.parent
-        else:
-            currNode = currNode.child(dest)
-
-    def parseLs(output):
-        # Parse a ls command and change cwd accordingly.
-        # `output` is the output of the command including the cmd line.
-        assert output[0] == "$ ls"
-        # The list of files/dirs under the current dir, e.g the output of ls.
-        files = output[1:]
-        # The cwd is always absolute, so remove the leading '/' before calling
-        # child().
-        for f in files:
-            parts = f.split(" ")
-            name = parts[1]
-            if parts[0] == "dir":
-                # f is a directory, add a new child.
-                child = Dir(name, currNode)
-                currNode.addChild(child)
-            else:
-                # f is a file.
-                size = int(parts[0])
-                child = File(name, currNode, size)
-                currNode.addChild(child)
-
-    while len(lines) > 0:
-        cmd = lines[0]
-        lines = lines[1:]
-        assert "$" in cmd
-        if "$ cd" in cmd:
-            parseCd([cmd])
-        elif "$ ls" in cmd:
-            output = []
-            for l in lines:
-                if l[0] != "$":
-                    output.append(l)
+    for l in fd:
+        parts = l.split()
+        if len(parts) == 0:
+            continue
+        if parts[0] == "$":
+            if parts[1] == "cd":
+                dest = parts[2]
+                if dest == "/":
+                    currNode = root
+                elif dest == "..":
+                    # Go up a directory.
+                    assert currNode.parent is not None
+                    currNode = currNode.parent
                 else:
-                    # Reached end of command's ouput.
-                    break
-            lines = lines[len(output):]
-            # Due to a quirk on how parseLs is written.
-            output = ["$ ls"] + output
-            parseLs(output)
+                    currNode = currNode.child(dest)
+            else:
+                # Unknown command? Most likely a bug.
+                assert parts[1] == "ls"
+        elif parts[0] == "dir":
+            # A directory in the output of ls, add a new child.
+            currNode.addChild(Dir(parts[1], currNode))
         else:
-            # Unknown command? Most likely a bug.
-            assert False
+            # A file in the output of ls.
+            currNode.addChild(File(parts[1], currNode, int(parts[0])))
+    fd.close()
 
-    return root
+    root.computeSizes()
+    return FilesystemIndex(root)
 
-def part1(inputFile):
-    root = parseFilesystem(inputFile)
-    return root.part1();
+def part1(index):
+    return index.totalAtMost(100000)
 
-def part2(inputFile):
-    root = parseFilesystem(inputFile)
-    free = 70000000 - root.size()
+def part2(index):
+    free = 70000000 - index.sizeOf("/")
     toDel = 30000000 - free
     assert toDel > 0
-    dirs = root.part2(toDel);
-    return min([d.size() for d in dirs])
+    return index.sizes[index.smallestAtLeast(toDel)]
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
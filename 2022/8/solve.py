@@ -1,94 +1,141 @@
 #!/usr/bin/env python
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-def parseInput(inputFile):
-    fd = open(inputFile, "r")
-    lines = fd.readlines()
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-    grid = []
-    for l in lines:
-        grid.append([int(x) for x in l.replace("\n","")])
-    fd.close()
-    return grid
+# Maps the digits of the input to the heights 0-9.
+HEIGHTS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
-def part1(inputFile):
-    grid = parseInput(inputFile)
-    gridWidth = len(grid[0])
-    gridHeight = len(grid)
+# Parse the input into a tuple (width, height, trees) where `trees` are the
+# heights of the trees of the grid, row by row: the tree at (x, y) is
+# trees[y * width + x].
+# If NumPy is installed, `trees` is instead a read-only array of shape
+# (height, width) and both parts are vectorized.
+def parseInput(inputFile):
+    fd = open(inputFile, "rb")
+    # Splitting on whitespace drops the line breaks, whatever they are, and
+    # any blank line.
+    rows = fd.read().split()
+    fd.close()
+    width = len(rows[0])
+    height = len(rows)
+    trees = b"".join(rows)
+    assert len(trees) == width * height
+    if numpy is not None:
+        trees = numpy.frombuffer(trees, dtype=numpy.uint8)
+        trees = trees.reshape(height, width) - ord("0")
+        trees.flags.writeable = False
+        return (width, height, trees)
+    return (width, height, trees.translate(HEIGHTS))
 
-    numBorderTrees = 2 * gridWidth + 2 * (gridHeight - 2)
-    # Number of trees visible in the grid.
-    numVisible = numBorderTrees
-    for y in range(1, gridHeight - 1):
-        for x in range(1, gridWidth - 1):
-            # The height of the tree.
-            h = grid[y][x]
-            # Compute the height of the trees in all four directions.
-            l = grid[y][:x]
-            r = grid[y][x+1:]
-            t = [grid[i][x] for i in range(0, y)]
-            b = [grid[i][x] for i in range(y + 1, gridHeight)]
-            isVisible = max(l) < h or max(r) < h or max(t) < h or max(b) < h
-            if isVisible:
-                numVisible += 1
-    return numVisible
+# Yield the lines of sight of the grid: for each row and column, the indices of
+# its trees (in the flat grid) going inwards from both of its edges.
+def sightLines(width, height):
+    size = width * height
+    for y in range(height):
+        yield range(y * width, (y + 1) * width)
+        yield range((y + 1) * width - 1, y * width - 1, -1)
+    for x in range(width):
+        yield range(x, size, width)
+        yield range(size - width + x, -1, -width)
 
-def part2(inputFile):
-    grid = parseInput(inputFile)
-    gridWidth = len(grid[0])
-    gridHeight = len(grid)
+# The four views of a grid array that have the lines of sight from each edge
+# along their rows, going from column 0 inwards. Writing into a view writes into
+# the grid.
+def numpyViews(grid):
+    return (grid, grid[:, ::-1], grid.T, grid.T[:, ::-1])
 
-    maxScore = 0
-    # Since trees on the edge have at least one of their viewing distances be 0,
-    # their scores will be 0 as well so we can skip them.
-    for y in range(1, gridHeight - 1):
-        for x in range(1, gridWidth - 1):
-            # The height of the tree.
-            h = grid[y][x]
-            # Compute the height of the trees in all four directions.
-            l = grid[y][:x]
-            r = grid[y][x+1:]
-            t = [grid[i][x] for i in range(0, y)]
-            b = [grid[i][x] for i in range(y + 1, gridHeight)]
-            
-            # Quick and dirty!
-            # For each direction we compute the index of the first tree that is
-            # taller than the current tree.
-            def getViewingDistance(viewVec, maxHeight):
-                # First crop the viewVec so that it only contains trees up to
-                # the first tree that is >= maxHeight.
-                a = []
-                # This is nasty.
-                for t in viewVec:
-                    if t < maxHeight:
-                        a.append(t)
-                    else:
-                        break
-                # If the tree has an unobstructed view (e.g. no tree was >=
-                # maxHeight) then the viewing distance is len(a) otherwise it 
-                # is len of a + 1 since it sees the tree that is >= maxHeight.
-                if len(a) == len(viewVec):
-                    # No tree was >= maxHeight
-                    return len(a)
-                else:
-                    return len(a) + 1
+# Vectorized part 1: a tree is visible from the left if it is taller than the
+# running maximum of the trees on its left. Same for the other edges through
+# the views of the grid.
+def numpyVisible(trees):
+    trees = trees.astype(numpy.int8)
+    visible = numpy.zeros(trees.shape, dtype=bool)
+    for view, visibleView in zip(numpyViews(trees), numpyViews(visible)):
+        before = numpy.full(view.shape, -1, dtype=numpy.int8)
+        numpy.maximum.accumulate(view[:, :-1], axis=1, out=before[:, 1:])
+        visibleView |= view > before
+    return visible
 
-            # Reverse the top and bottom viewing directions, so that array[0]
-            # becomes the closest tree in that direction. This means that we can
-            # use the same logic as with right and bottom.
-            l.reverse()
-            t.reverse()
+# Vectorized part 2: for each height h, the position of the closest tree at
+# least h tall on the left of each tree is the running maximum of the positions
+# of the trees >= h. The viewing distance of the trees of height h follows. Same
+# for the other edges through the views of the grid.
+def numpyScenicScores(trees):
+    scores = numpy.ones(trees.shape, dtype=numpy.int64)
+    for view, scoresView in zip(numpyViews(trees), numpyViews(scores)):
+        # The running maximums are much faster on contiguous rows.
+        view = numpy.ascontiguousarray(view)
+        pos = numpy.arange(view.shape[1], dtype=numpy.int32)
+        dist = numpy.zeros(view.shape, dtype=numpy.int32)
+        # blocker[:, i] is the position of the closest tree >= h strictly
+        # before position i, the edge being at position 0.
+        blocker = numpy.zeros(view.shape, dtype=numpy.int32)
+        for h in range(10):
+            numpy.multiply(view[:, :-1] >= h, pos[:-1], out=blocker[:, 1:])
+            numpy.maximum.accumulate(blocker[:, 1:], axis=1,
+                                     out=blocker[:, 1:])
+            numpy.subtract(pos, blocker, out=blocker)
+            numpy.copyto(dist, blocker, where=view == h)
+        scoresView *= dist
+    return scores
 
-            lvd = getViewingDistance(l, h)
-            rvd = getViewingDistance(r, h)
-            tvd = getViewingDistance(t, h)
-            bvd = getViewingDistance(b, h)
+def part1(forest):
+    width, height, trees = forest
+    if numpy is not None:
+        return int(numpy.count_nonzero(numpyVisible(trees)))
+    visible = bytearray(len(trees))
+    # A tree is visible from an edge if it is taller than all the trees before
+    # it on a line of sight from that edge.
+    for line in sightLines(width, height):
+        tallest = -1
+        for i in line:
+            h = trees[i]
+            if h > tallest:
+                visible[i] = 1
+                tallest = h
+                if tallest == 9:
+                    # Nothing can be seen behind the tallest trees.
+                    break
+    return visible.count(1)
 
-            maxScore = max(maxScore, lvd * rvd * tvd * bvd)
-    return maxScore
+def part2(forest):
+    width, height, trees = forest
+    if numpy is not None:
+        return int(numpyScenicScores(trees).max())
+    scores = [1] * len(trees)
+    # Going along a line of sight, the viewing distance of a tree towards the
+    # edge is the distance to the closest tree before it that is at least as
+    # tall, or to the edge if there is none. The trees that can still block the
+    # view of the next ones are kept on a stack, from the edge inwards: a tree
+    # hides all the shorter ones behind it, hence the heights on the stack are
+    # decreasing and there are at most 10 of them.
+    for line in sightLines(width, height):
+        stackHeights = []
+        stackPos = []
+        for pos, i in enumerate(line):
+            h = trees[i]
+            while len(stackHeights) > 0 and stackHeights[-1] < h:
+                stackHeights.pop()
+                stackPos.pop()
+            # The trees on the edges have a viewing distance of 0.
+            scores[i] *= pos - (stackPos[-1] if len(stackPos) > 0 else 0)
+            if len(stackHeights) > 0 and stackHeights[-1] == h:
+                # The tree of the same height before this one is now hidden.
+                stackPos[-1] = pos
+            else:
+                stackHeights.append(h)
+                stackPos.append(pos)
+    return max(scores)
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
@@ -1,14 +1,32 @@
 #!/usr/bin/env python
 
-import sys
 from enum import Enum
 
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
 class Direction(Enum):
     Right = 1
     Left = 2
     Up = 4
     Down = 8
 
+# The (dx, dy) of a step in each direction.
+DIRECTION_DELTA = {
+    Direction.Right: (1, 0),
+    Direction.Left: (-1, 0),
+    Direction.Up: (0, -1),
+    Direction.Down: (0, 1),
+}
+
+# Number of knots of the ropes of part 1 and part 2.
+PART1_KNOTS = 2
+PART2_KNOTS = 10
+
 class Motion:
     def __init__(self, d, steps):
         self.direction = d
@@ -30,100 +48,114 @@ def charToDirection(char):
     else:
         raise Exception("Unknown direction: " + char)
 
-# Read the input file and return a list of the moves to perform.
+# Pack a position into a single int. For |y| < 2^31 this is unique, and moving
+# by (dx, dy) adds pack(dx, dy) to the packed position.
+def pack(x, y):
+    return (x << 32) + y
+
+# A rope of `numKnots` knots, all starting at (0, 0). The positions visited by
+# the knots listed in `trackedKnots` are recorded, knot 0 being the head.
+# The knots only depend on the knots before them, hence the knot k of a rope
+# moves exactly as the tail of a rope of k + 1 knots: a single rope answers for
+# all the shorter ropes.
+# A motion of the head is propagated down the rope as runs of identical steps
+# [dx, dy, count]. A knot following a run of its leader reaches a steady state
+# after a couple of steps: once it makes the same step as its leader, the offset
+# between the two does not change anymore and it makes that step for the rest of
+# the run, which is then done at once. When a knot does not move, the knots
+# after it do not either and the motion stops there.
+class Rope:
+    def __init__(self, numKnots, trackedKnots):
+        assert numKnots >= 1
+        self.xs = [0] * numKnots
+        self.ys = [0] * numKnots
+        # Maps each tracked knot to the set of its packed visited positions.
+        self.visited = {k: {pack(0, 0)} for k in trackedKnots}
+
+    # Move the head of `steps` steps in `direction`.
+    def move(self, direction, steps):
+        xs = self.xs
+        ys = self.ys
+        dx, dy = DIRECTION_DELTA[direction]
+        runs = [[dx, dy, steps]]
+        for k in range(len(xs)):
+            # Position of the knot before the motion.
+            startX = xs[k]
+            startY = ys[k]
+            if k == 0:
+                xs[0] += dx * steps
+                ys[0] += dy * steps
+            else:
+                runs = self.__follow(k, runs, leaderX, leaderY)
+            if k in self.visited:
+                self.__visit(self.visited[k], startX, startY, runs)
+            if len(runs) == 0:
+                break
+            leaderX = startX
+            leaderY = startY
+
+    # Move the knot `k` after its leader, starting at (leaderX, leaderY) and
+    # doing the steps in `runs`. Return the runs of steps of the knot.
+    def __follow(self, k, runs, leaderX, leaderY):
+        x = self.xs[k]
+        y = self.ys[k]
+        res = []
+        for dx, dy, count in runs:
+            while count > 0:
+                leaderX += dx
+                leaderY += dy
+                count -= 1
+                offsetX = leaderX - x
+                offsetY = leaderY - y
+                if -1 <= offsetX <= 1 and -1 <= offsetY <= 1:
+                    # Still touching, the knot does not move.
+                    continue
+                stepX = (offsetX > 0) - (offsetX < 0)
+                stepY = (offsetY > 0) - (offsetY < 0)
+                n = 1
+                if stepX == dx and stepY == dy:
+                    # Steady state, the knot follows for the rest of the run.
+                    n += count
+                    leaderX += dx * count
+                    leaderY += dy * count
+                    count = 0
+                x += stepX * n
+                y += stepY * n
+                if len(res) > 0 and res[-1][0] == stepX and res[-1][1] == stepY:
+                    res[-1][2] += n
+                else:
+                    res.append([stepX, stepY, n])
+        self.xs[k] = x
+        self.ys[k] = y
+        return res
+
+    # Add the positions visited by a knot starting at (x, y) and doing the steps
+    # in `runs` to `visited`.
+    def __visit(self, visited, x, y, runs):
+        p = pack(x, y)
+        for dx, dy, count in runs:
+            d = pack(dx, dy)
+            visited.update(range(p + d, p + d * (count + 1), d))
+            p += d * count
+
+# Read the input file and simulate the moves on a rope of PART2_KNOTS knots.
+# Return a dict mapping a number of knots to the number of positions visited by
+# the tail of a rope with that number of knots.
 def parseInput(inputFile):
     fd = open(inputFile, "r")
-    lines = fd.readlines()
-    moves = []
-    for l in lines:
+    rope = Rope(PART2_KNOTS, [PART1_KNOTS - 1, PART2_KNOTS - 1])
+    for l in fd:
         d, s = l.split(" ")
         motion = Motion(charToDirection(d), int(s))
-        moves.append(motion)
+        rope.move(motion.direction, motion.steps)
     fd.close()
-    return moves
-
-# Describe the position (x, y) in the 2D plane.
-class Position:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    # Compute the next position if we move from that position to the given
-    # direction.
-    def next(self, direction):
-        if direction == Direction.Right:
-            return Position(self.x+1, self.y)
-        elif direction == Direction.Left:
-            return Position(self.x-1, self.y)
-        elif direction == Direction.Up:
-            return Position(self.x, self.y-1)
-        elif direction == Direction.Down:
-            return Position(self.x, self.y+1)
-        else:
-            raise Exception("Invalid direction")
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
+    return {k + 1: len(v) for k, v in rope.visited.items()}
 
-    def __repr__(self):
-        return "(" + str(self.x) + " " + str(self.y) + ")"
-
-# For a given configuration head and tail, compute the next position of the
-# tail. Return the Position object.
-def updateTail(head, tail):
-    # First check if head and tail are touching.
-    if abs(head.x - tail.x) <= 1 and abs(head.y - tail.y) <= 1:
-        # Head and tail are touching, no need to update the tail. This condition
-        # also handles the case where the head and tail are overlapping.
-        return Position(tail.x, tail.y)
-    
-    dx = head.x - tail.x
-    dy = head.y - tail.y
-    newX = tail.x + ((dx // abs(dx)) if dx != 0 else 0)
-    newY = tail.y + ((dy // abs(dy)) if dy != 0 else 0)
-    return Position(newX, newY)
-
-def part1(inputFile):
-    moves = parseInput(inputFile)
-
-    head = Position(0, 0)
-    tail = Position(0, 0)
-
-    # Hold the positions visited by the tail.
-    visited = {}
-    visited[tail] = True
-
-    for m in moves:
-        for s in range(0, m.steps):
-            head = head.next(m.direction)
-            tail = updateTail(head, tail)
-            visited[tail] = True
-
-    return len(visited.keys())
-
-def part2(inputFile):
-    moves = parseInput(inputFile)
-
-    numKnots = 10
-    knots = [Position(0, 0) for i in range(0, numKnots)]
-
-    # Hold the positions visited by the tail.
-    visited = {}
-    visited[knots[-1]] = True
-
-    for m in moves:
-        for s in range(0, m.steps):
-            knots[0] = knots[0].next(m.direction)
-            for i in range(1, numKnots):
-                knots[i] = updateTail(knots[i-1], knots[i])
-            visited[knots[-1]] = True
-
-    return len(visited.keys())
+def part1(visits):
+    return visits[PART1_KNOTS]
+
+def part2(visits):
+    return visits[PART2_KNOTS]
 
 if __name__ == "__main__":
-    inputFile = sys.argv[1]
-    print("Part 1: {}".format(part1(inputFile)))
-    print("Part 2: {}".format(part2(inputFile)))
+    run(parseInput, part1, part2)
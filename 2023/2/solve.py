@@ -1,6 +1,11 @@
 #!/bin/python3
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
 def processSet(s):
     # s is of the form "N color, M color"
@@ -10,25 +15,39 @@ def processSet(s):
         res[color] = int(num)
     return res
 
-if __name__ == "__main__":
-    fd = open(sys.argv[1], "r")
-    part1 = 0
-    part2 = 0
+# Parse the input file and return a tuple of (gameId, sets) where sets is the
+# list of the sets of cubes revealed during the game.
+def parseInput(inputFile):
+    fd = open(inputFile, "r")
+    games = []
     for line in fd.readlines():
         parts = line.split(":")
         gameId = int(parts[0].split(" ")[1])
         sets = list(map(lambda s: processSet(s), parts[1].split(";")))
+        games.append((gameId, sets))
+    fd.close()
+    return tuple(games)
+
+def part1(games):
+    res = 0
+    for gameId, sets in games:
         part1Possible = True
-        minReds = max([s["red"] for s in sets])
-        minGreen = max([s["green"] for s in sets])
-        minBlue = max([s["blue"] for s in sets])
         for s in sets:
             if s["red"] > 12 or s["green"] > 13 or s["blue"] > 14:
                 part1Possible = False
                 break
         if part1Possible:
-            part1 += gameId
-        part2 += minReds * minGreen * minBlue
-    print("Part 1: {}".format(part1))
-    print("Part 2: {}".format(part2))
+            res += gameId
+    return res
 
+def part2(games):
+    res = 0
+    for _, sets in games:
+        minReds = max([s["red"] for s in sets])
+        minGreen = max([s["green"] for s in sets])
+        minBlue = max([s["blue"] for s in sets])
+        res += minReds * minGreen * minBlue
+    return res
+
+if __name__ == "__main__":
+    run(parseInput, part1, part2)
@@ -3,22 +3,39 @@
 # This is some poorly written inefficient python code due to the fact that I had
 # a late start and needed to quickly catch-up.
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-puzzle_input = list(filter(lambda l: len(l) > 0, open(sys.argv[1], "r").read().split("\n")))
-left = sorted(list(map(lambda e: int(e.split()[0]), puzzle_input)))
-right = sorted(list(map(lambda e: int(e.split()[1]), puzzle_input)))
-sol = 0
-for i in range(len(left)):
-    sol += abs(left[i] - right[i])
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: A tuple (left, right) of the two sorted lists of location IDs.
+def parse(path):
+    puzzle_input = list(filter(lambda l: len(l) > 0, open(path, "r").read().split("\n")))
+    left = tuple(sorted(map(lambda e: int(e.split()[0]), puzzle_input)))
+    right = tuple(sorted(map(lambda e: int(e.split()[1]), puzzle_input)))
+    return left, right
 
-print(f"Part 1: {sol}")
+def part1(data):
+    left, right = data
+    sol = 0
+    for i in range(len(left)):
+        sol += abs(left[i] - right[i])
+    return sol
 
-freq = {}
-for e in right:
-    freq[e] = freq.get(e, 0) + 1
+def part2(data):
+    left, right = data
+    freq = {}
+    for e in right:
+        freq[e] = freq.get(e, 0) + 1
 
-sol = 0
-for e in left:
-    sol += e * freq.get(e, 0)
-print(f"Part 2: {sol}")
+    sol = 0
+    for e in left:
+        sol += e * freq.get(e, 0)
+    return sol
+
+if __name__ == "__main__":
+    run(parse, part1, part2)
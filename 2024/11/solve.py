@@ -1,10 +1,19 @@
 #!/bin/python3
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-ORIG_STONES = list(
-    map(lambda s: int(s),
-        open(sys.argv[1], "r").readline().replace("\n", "").split(" ")))
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: The tuple of stones.
+def parse(path):
+    return tuple(
+        map(lambda s: int(s),
+            open(path, "r").readline().replace("\n", "").split(" ")))
 
 # Given a list of stones, apply the rules once and all the stones.
 # @param stones: The list of stones.
@@ -35,19 +44,16 @@ def apply_rules(stones):
             res.append(s * 2024)
     return res
 
-stones = ORIG_STONES
-for i in range(25):
-    stones = apply_rules(stones)
-
-part1 = len(stones)
-print(f"Part 1: {part1}")
+def part1(stones):
+    for i in range(25):
+        stones = apply_rules(stones)
+    return len(stones)
 
 # If f give len of array after N iterations, then
 #   f(a1 a2 a3, N) = f(a1, N) + f(a2, N) + f(a3, N)
 # We can then use a cache to save the value of f(a, N) for all arrays of len 1
-# (i.e. for individual stones).
-cache = {}
-def f(a, N):
+# (i.e. for individual stones). The cache is owned by the caller.
+def f(a, N, cache):
     if N == 0:
         return len(a)
     elif len(a) == 1:
@@ -76,16 +82,17 @@ def f(a, N):
             # stone; the old stone's number multiplied by 2024 is engraved on
             # the new stone.
             res.append(s * 2024)
-        res = f(res, N - 1)
+        res = f(res, N - 1, cache)
         cache[key] = res
         return res
     else:
         res = 0
         for e in a:
-            res += f([e], N)
+            res += f([e], N, cache)
         return res
 
-stones = ORIG_STONES
+def part2(stones):
+    return f(stones, 75, {})
 
-part2 = f(stones, 75)
-print(f"Part 2: {part2}")
+if __name__ == "__main__":
+    run(parse, part1, part2)
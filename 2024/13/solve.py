@@ -1,37 +1,14 @@
 #!/bin/python3
 
-import sys
 from dataclasses import dataclass
 
-# Representation of a 2D position.
-class Pos2d:
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-
-    def __str__(self) -> str:
-        return f"({self.x}, {self.y})"
-
-    def __repr__(self) -> str:
-        return self.__str__()
-
-    def __eq__(self, other) -> bool:
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __sub__(self, other):
-        return Pos2d(self.x - other.x, self.y - other.y)
-
-    def __add__(self, other):
-        return Pos2d(self.x + other.x, self.y + other.y)
-
-    def __neg__(self):
-        return Pos2d(-self.x, -self.y)
-
-    def __mul__(self, scalar):
-        return Pos2d(self.x * scalar, self.y * scalar)
-
-    def __hash__(self):
-        return hash((self.x, self.y))
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+from aoc.position import Position as Pos2d
 
 INF = (1 << 32)
 
@@ -70,7 +47,10 @@ def parse_button(line):
     x = int(parts[1].split(",")[0])
     return Pos2d(x, y)
 
-def parse_input(filename):
+# Parse the input file.
+# @param filename: Path to the input file.
+# @return: The tuple of Machines.
+def parse(filename):
     fd = open(filename, "r")
     lines = fd.readlines()
     res = []
@@ -86,13 +66,15 @@ def parse_input(filename):
         x = int(parts[1].split(",")[0])
         prize = Pos2d(x, y)
         res.append(Machine(ba, bb, prize))
+    return tuple(res)
+
+def part1(machines):
+    res = 0
+    for m in machines:
+        s = m.solve()
+        if s != INF:
+            res += s
     return res
 
-machines = parse_input(sys.argv[1])
-
-part1 = 0
-for m in machines:
-    s = m.solve()
-    if s != INF:
-        part1 += s
-print(f"Part 1: {part1}")
+if __name__ == "__main__":
+    run(parse, part1)
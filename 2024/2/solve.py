@@ -3,19 +3,28 @@
 # This is some poorly written inefficient python code due to the fact that I had
 # a late start and needed to quickly catch-up.
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-reports = list(filter(lambda l: len(l) > 0, open(sys.argv[1], "r").read().split("\n")))
-reports = list(map(lambda l: l.split(), reports))
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: A tuple of reports, each report being a tuple of levels.
+def parse(path):
+    reports = list(filter(lambda l: len(l) > 0, open(path, "r").read().split("\n")))
+    return tuple(map(lambda l: tuple(map(int, l.split())), reports))
 
 def is_safe(report):
-    prev = int(report[0])
+    prev = report[0]
     # -1 -> decreasing
     # 0  -> unknown
     # 1  -> increasing
     trend = 0
     for i in range(1, len(report)):
-        curr = int(report[i])
+        curr = report[i]
         diff = curr - prev
         curr_trend = (diff / abs(diff)) if diff != 0 else 0
         if (not (1 <= abs(diff) <= 3)) or (trend != 0 and trend != curr_trend):
@@ -24,22 +33,26 @@ def is_safe(report):
         prev = curr
     return True
 
-sol = 0
-for r in reports:
-    if is_safe(r):
-        sol += 1
-print(f"Part 1: {sol}")
+def part1(reports):
+    sol = 0
+    for r in reports:
+        if is_safe(r):
+            sol += 1
+    return sol
 
-sol = 0
-for r in reports:
-    if is_safe(r):
-        sol += 1
-    else:
-        # This is probably the worst code I have ever written in my life...
-        for i in range(len(r)):
-            rc = r.copy()
-            del rc[i]
-            if is_safe(rc):
-                sol += 1
-                break
-print(f"Part 2: {sol}")
+def part2(reports):
+    sol = 0
+    for r in reports:
+        if is_safe(r):
+            sol += 1
+        else:
+            # This is probably the worst code I have ever written in my life...
+            for i in range(len(r)):
+                rc = r[:i] + r[i+1:]
+                if is_safe(rc):
+                    sol += 1
+                    break
+    return sol
+
+if __name__ == "__main__":
+    run(parse, part1, part2)
@@ -1,9 +1,18 @@
 #!/bin/python3
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-lines = list(map(lambda l: l.replace("\n", ""),
-                 open(sys.argv[1], "r").readlines()))
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: The tuple of lines of the word search.
+def parse(path):
+    return tuple(map(lambda l: l.replace("\n", ""),
+                     open(path, "r").readlines()))
 
 def search_part1(lines, x, y, pattern):
     if lines[y][x] != pattern[0]:
@@ -24,11 +33,12 @@ def search_part1(lines, x, y, pattern):
                     matches += 1
     return matches
 
-part1 = 0
-for y in range(len(lines)):
-    for x in range(len(lines[y])):
-        part1 += search_part1(lines, x, y, "XMAS")
-print(f"Part 1: {part1}")
+def part1(lines):
+    res = 0
+    for y in range(len(lines)):
+        for x in range(len(lines[y])):
+            res += search_part1(lines, x, y, "XMAS")
+    return res
 
 def search_part2(lines, x, y):
     if lines[y][x] != "A":
@@ -40,8 +50,12 @@ def search_part2(lines, x, y):
     else:
         return 0
 
-part2 = 0
-for y in range(1, len(lines) - 1):
-    for x in range(1, len(lines[y]) - 1):
-        part2 += search_part2(lines, x, y)
-print(f"Part 2: {part2}")
+def part2(lines):
+    res = 0
+    for y in range(1, len(lines) - 1):
+        for x in range(1, len(lines[y]) - 1):
+            res += search_part2(lines, x, y)
+    return res
+
+if __name__ == "__main__":
+    run(parse, part1, part2)
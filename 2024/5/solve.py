@@ -2,25 +2,39 @@
 
 # Nasty stuff. Had to write it in a hurry.
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-fd = open(sys.argv[1], "r")
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: A tuple (rules, updates). `rules` maps a page to the tuple of pages
+# that must appear after it. `updates` is a tuple of updates, each update being
+# a tuple of pages.
+def parse(path):
+    fd = open(path, "r")
 
-rules = {}
+    rules = {}
 
-line = fd.readline()
-while line != "\n":
-    line = line.replace("\n", "")
-    assert "|" in line
-    left, right = line.split("|")
-    left, right = int(left), int(right)
-    if left in rules.keys():
-        rules[left].append(right)
-    else:
-        rules[left] = [right]
     line = fd.readline()
+    while line != "\n":
+        line = line.replace("\n", "")
+        assert "|" in line
+        left, right = line.split("|")
+        left, right = int(left), int(right)
+        rules[left] = rules.get(left, ()) + (right,)
+        line = fd.readline()
+
+    lines = fd.readlines()
+    lines = list(map(lambda l: l.replace("\n", ""), lines))
+    updates = tuple(map(lambda l: tuple(map(lambda e: int(e), l.split(","))), lines))
+    fd.close()
+    return rules, updates
 
-def valid(updated_pages, curr):
+def valid(rules, updated_pages, curr):
     if curr not in rules.keys():
         # No ordering constraints to add the current page, so far this is a
         # valid sequence.
@@ -31,24 +45,22 @@ def valid(updated_pages, curr):
                 return False
         return True
 
-part1 = 0
-
-lines = fd.readlines()
-lines = list(map(lambda l: l.replace("\n", ""), lines))
-
-for line in lines:
-    # Process new rule
-    pages = list(map(lambda e: int(e), line.split(",")))
-    valid_update = True
+def is_valid_update(rules, pages):
     for i in range(len(pages)):
-        if not valid(pages[:i], pages[i]):
-            valid_update = False
-            break
-    if valid_update:
-        part1 += pages[len(pages) // 2]
-print(f"Part 1: {part1}")
+        if not valid(rules, pages[:i], pages[i]):
+            return False
+    return True
 
-def fixup(pages):
+def part1(data):
+    rules, updates = data
+    res = 0
+    for pages in updates:
+        if is_valid_update(rules, pages):
+            res += pages[len(pages) // 2]
+    return res
+
+# Fix the order of the pages of an update. `pages` is modified in place.
+def fixup(rules, pages):
     for i in range(1, len(pages)):
         for j in range(i):
             pj, pi = pages[j], pages[i]
@@ -60,19 +72,14 @@ def fixup(pages):
                 break
     return pages 
 
-part2 = 0
-lines = list(
-        map(
-            lambda l: list(map(lambda e: int(e), l.split(","))),
-            lines))
-for pages in lines:
-    # Process new rule
-    valid_update = True
-    for i in range(len(pages)):
-        if not valid(pages[:i], pages[i]):
-            valid_update = False
-            break
-    if not valid_update:
-        fixed = fixup(pages)
-        part2 += fixed[len(fixed) // 2]
-print(f"Part 2: {part2}")
+def part2(data):
+    rules, updates = data
+    res = 0
+    for pages in updates:
+        if not is_valid_update(rules, pages):
+            fixed = fixup(rules, list(pages))
+            res += fixed[len(fixed) // 2]
+    return res
+
+if __name__ == "__main__":
+    run(parse, part1, part2)
@@ -1,12 +1,26 @@
 #!/bin/python3
 
-import sys
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
 
-fd = open(sys.argv[1], "r")
-lines = list(map(lambda l: l.replace("\n", ""), fd.readlines()))
-grid = list(filter(lambda l: len(l) > 0, lines))
-grid = list(map(lambda l: list(l), grid))
-fd.close()
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: The grid as a tuple of strings. The simulations write the guard's
+# orientation into the grid, hence they work on a copy of it, see copy_grid.
+def parse(path):
+    fd = open(path, "r")
+    lines = list(map(lambda l: l.replace("\n", ""), fd.readlines()))
+    grid = tuple(filter(lambda l: len(l) > 0, lines))
+    fd.close()
+    return grid
+
+# Create a mutable copy of the parsed grid.
+def copy_grid(grid):
+    return list(map(lambda l: list(l), grid))
 
 def find_guard(grid):
     guard_orientations = ["^", "<", ">", "v"]
@@ -18,9 +32,6 @@ def find_guard(grid):
             except:
                 pass
 
-startY, startX = find_guard(grid)
-currY, currX = find_guard(grid)
-
 delta_YX = {
     "^": (-1, 0),
     "<": (0, -1),
@@ -37,66 +48,71 @@ def rotated(guard):
     }
     return r[guard]
 
-visited = set()
+def part1(grid):
+    grid = copy_grid(grid)
+    currY, currX = find_guard(grid)
 
-part1 = 0
-while 0 <= currY < len(grid) and 0 <= currX < len(grid[currY]):
-    if (currY, currX) not in visited:
-        part1 += 1
-        visited.add((currY, currX))
-    g = grid[currY][currX]
-    dy, dx = delta_YX[g]
-    nextY, nextX = currY + dy, currX + dx
-    step = False
-    if 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]) and grid[nextY][nextX] == "#":
-        # Stay in same spot and rotate to the right.
-        grid[currY][currX] = rotated(g)
-    elif 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]):
-        grid[nextY][nextX] = g
-        currY, currX = nextY, nextX
-    else:
-        currY, currX = nextY, nextX
-print(f"Part 1: {part1}")
+    visited = set()
+
+    res = 0
+    while 0 <= currY < len(grid) and 0 <= currX < len(grid[currY]):
+        if (currY, currX) not in visited:
+            res += 1
+            visited.add((currY, currX))
+        g = grid[currY][currX]
+        dy, dx = delta_YX[g]
+        nextY, nextX = currY + dy, currX + dx
+        step = False
+        if 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]) and grid[nextY][nextX] == "#":
+            # Stay in same spot and rotate to the right.
+            grid[currY][currX] = rotated(g)
+        elif 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]):
+            grid[nextY][nextX] = g
+            currY, currX = nextY, nextX
+        else:
+            currY, currX = nextY, nextX
+    return res
 
 # Brute force.
-part2 = 0
-for ny in range(len(grid)):
-    for nx in range(len(grid[0])):
-        if ny == startY and nx == startX:
-            continue
-        fd = open(sys.argv[1], "r")
-        lines = list(map(lambda l: l.replace("\n", ""), fd.readlines()))
-        grid = list(filter(lambda l: len(l) > 0, lines))
-        grid = list(map(lambda l: list(l), grid))
-        fd.close()
+def part2(orig_grid):
+    startY, startX = find_guard(orig_grid)
+    res = 0
+    for ny in range(len(orig_grid)):
+        for nx in range(len(orig_grid[0])):
+            if ny == startY and nx == startX:
+                continue
+            grid = copy_grid(orig_grid)
+
+            grid[ny][nx] = "#"
 
-        grid[ny][nx] = "#"
+            currY, currX = startY, startX
+            startO = grid[currY][currX]
+            visited = {}
 
-        currY, currX = find_guard(grid)
-        startO = grid[currY][currX]
-        visited = {}
+            steps = 0
+            while 0 <= currY < len(grid) and 0 <= currX < len(grid[currY]):
+                g = grid[currY][currX]
+                if (currY, currX) in visited.keys() and g in visited[(currY, currX)]:
+                    res += 1
+                    break
 
-        steps = 0
-        while 0 <= currY < len(grid) and 0 <= currX < len(grid[currY]):
-            g = grid[currY][currX]
-            if (currY, currX) in visited.keys() and g in visited[(currY, currX)]:
-                part2 += 1
-                break
+                if (currY, currX) in visited.keys():
+                    visited[(currY, currX)].append(g)
+                else:
+                    visited[(currY, currX)] = [g]
+                dy, dx = delta_YX[g]
+                nextY, nextX = currY + dy, currX + dx
+                step = False
+                if 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]) and grid[nextY][nextX] == "#":
+                    # Stay in same spot and rotate to the right.
+                    grid[currY][currX] = rotated(g)
+                elif 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]):
+                    grid[nextY][nextX] = g
+                    currY, currX = nextY, nextX
+                else:
+                    currY, currX = nextY, nextX
+                steps += 1
+    return res
 
-            if (currY, currX) in visited.keys():
-                visited[(currY, currX)].append(g)
-            else:
-                visited[(currY, currX)] = [g]
-            dy, dx = delta_YX[g]
-            nextY, nextX = currY + dy, currX + dx
-            step = False
-            if 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]) and grid[nextY][nextX] == "#":
-                # Stay in same spot and rotate to the right.
-                grid[currY][currX] = rotated(g)
-            elif 0 <= nextY < len(grid) and 0 <= nextX < len(grid[nextY]):
-                grid[nextY][nextX] = g
-                currY, currX = nextY, nextX
-            else:
-                currY, currX = nextY, nextX
-            steps += 1
-print(f"Part 2: {part2}")
+if __name__ == "__main__":
+    run(parse, part1, part2)
@@ -1,15 +1,21 @@
 #!/bin/python3
 
-import sys
 from dataclasses import dataclass
 
-@dataclass
+if not __package__:
+    import os
+    import sys
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", ".."))
+from aoc.day import run
+
+@dataclass(frozen=True)
 class CalibrationEquation:
     target: int
-    operands: list[int]
+    operands: tuple[int, ...]
 
     def is_solvable(self, part2: bool) -> bool:
-        def inner(acc: int, l: list[int]) -> bool:
+        def inner(acc: int, l: tuple[int, ...]) -> bool:
             if len(l) == 0:
                 return acc == self.target
             else:
@@ -26,16 +32,23 @@ class CalibrationEquation:
                 return False
         return inner(self.operands[0], self.operands[1:])
 
-equations = []
-fd = open(sys.argv[1], "r")
-for line in fd:
-    line = line.replace("\n", "")
-    left, right = line.split(": ")
-    target = int(left)
-    operands = list(map(lambda e: int(e), right.split()))
-    equations.append(CalibrationEquation(target, operands))
+# Parse the input file.
+# @param path: Path to the input file.
+# @return: A tuple of CalibrationEquation.
+def parse(path):
+    equations = []
+    fd = open(path, "r")
+    for line in fd:
+        line = line.replace("\n", "")
+        left, right = line.split(": ")
+        target = int(left)
+        operands = tuple(map(lambda e: int(e), right.split()))
+        equations.append(CalibrationEquation(target, operands))
+    fd.close()
+    return tuple(equations)
 
-part1 = sum(
+def part1(equations):
+    return sum(
             map(
                 lambda e: e.target,
                 filter(
@@ -43,9 +56,9 @@ part1 = sum(
                     equations)
                 )
             )
-print(f"Part 1: {part1}")
 
-part2 = sum(
+def part2(equations):
+    return sum(
             map(
                 lambda e: e.target,
                 filter(
@@ -53,4 +66,6 @@ part2 = sum(
                     equations)
                 )
             )
-print(f"Part 2: {part2}")
+
+if __name__ == "__main__":
+    run(parse, part1, part2)
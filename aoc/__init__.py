@@ -0,0 +1,2 @@
+# Shared tooling for the Advent Of Code solutions: benchmarking, and the bits
+# of code that used to be copy-pasted from one day to the next.
@@ -0,0 +1,388 @@
+#!/bin/python3
+
+# In-process benchmark runner for every day's solve.py.
+#
+# Usage, from the root of the repository:
+#   python -m aoc.bench [-n RUNS] [--json FILE] [--no-memory] [--phases]
+#                       [--scale S [--seed N]] [DAY ...]
+# where DAY is either a year ("2022") or a year/day pair ("2022/16"). Without
+# any DAY, all the days having an input file are benchmarked.
+# With --scale, the days are run against inputs generated by aoc/generate.py
+# instead of their real input, `S` times bigger than the real one. Days without
+# a generator are skipped.
+#
+# Each day is loaded in the current interpreter and run against its `input` or
+# `input.txt` file. Days exposing `part1` (and `part2`, if solved) functions are
+# timed one part at a time. If the day also exposes a parse function (`parse` or
+# `parseInput`), the input is parsed once in its own "parse" phase and the
+# parsed input is handed to both parts. Days doing all their work at module
+# level are executed as a whole and reported as a single "script" phase.
+# For each phase the wall time and CPU time of every run is recorded, and the
+# peak memory is measured with tracemalloc in an extra run so that the tracing
+# overhead does not skew the timings.
+# With --phases, each phase is run one more time while recording the phases
+# marked in the solution with aoc/instrument.py (e.g. the precomputation vs the
+# search). Their wall time, peak memory and allocations are added to the JSON
+# under "breakdown", and printed below the table.
+
+import argparse
+import ast
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import re
+import runpy
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from aoc.generate import GENERATORS, generate
+from aoc.instrument import PhaseStats, recording
+
+# Root of the repository, i.e. the directory containing the year directories.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Name of the input files, in order of preference.
+INPUT_NAMES = ["input", "input.txt"]
+
+# A day's solution found on disk.
+@dataclass
+class Day:
+    year: int
+    day: int
+    # Absolute path to the solve.py.
+    script: str
+    # Absolute path to the input file.
+    input: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day}"
+
+# Measurements for a single phase (e.g. part1) of a day.
+@dataclass
+class PhaseResult:
+    phase: str
+    answer: Any = None
+    # One entry per run, in seconds.
+    wall: list[float] = field(default_factory=list)
+    cpu: list[float] = field(default_factory=list)
+    # Peak of the memory allocated during the phase, in bytes. None if not
+    # measured.
+    peak_mem: int | None = None
+    # Phases marked in the solution and recorded during this phase, see
+    # aoc/instrument.py. None if not recorded.
+    breakdown: dict[str, PhaseStats] | None = None
+
+    def to_json(self) -> dict:
+        return {
+            "phase": self.phase,
+            "answer": None if self.answer is None else str(self.answer),
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "wall_min": min(self.wall),
+            "wall_median": statistics.median(self.wall),
+            "cpu_min": min(self.cpu),
+            "cpu_median": statistics.median(self.cpu),
+            "peak_mem": self.peak_mem,
+            "breakdown": None if self.breakdown is None else \
+                {k: v.to_json() for k, v in self.breakdown.items()},
+        }
+
+# Find all the days under `root`.
+# @param root: Root of the repository.
+# @return: The list of days having both a solve.py and an input file, sorted by
+# year then day.
+def find_days(root: str = ROOT) -> list[Day]:
+    days = []
+    for year in os.listdir(root):
+        if not year.isdigit() or not os.path.isdir(os.path.join(root, year)):
+            continue
+        for day in os.listdir(os.path.join(root, year)):
+            path = os.path.join(root, year, day)
+            script = os.path.join(path, "solve.py")
+            if not day.isdigit() or not os.path.isfile(script):
+                continue
+            inputs = [os.path.join(path, n) for n in INPUT_NAMES \
+                      if os.path.isfile(os.path.join(path, n))]
+            if len(inputs) == 0:
+                continue
+            days.append(Day(int(year), int(day), script, inputs[0]))
+    days.sort(key=lambda d: (d.year, d.day))
+    return days
+
+# Select a subset of days.
+# @param days: The list of days to select from.
+# @param selectors: List of "YEAR" or "YEAR/DAY" strings. An empty list selects
+# all the days.
+# @return: The selected days, in the same order as `days`.
+def select_days(days: list[Day], selectors: list[str]) -> list[Day]:
+    if len(selectors) == 0:
+        return days
+    res = []
+    for d in days:
+        for s in selectors:
+            s = s.strip("/")
+            if s == str(d.year) or s == d.name:
+                res.append(d)
+                break
+    return res
+
+# Replace the input of the days by generated inputs.
+# @param days: The days to generate an input for.
+# @param scale, seed: Parameters of the generators, see aoc/generate.py.
+# @param directory: Directory to write the inputs into.
+# @return: The days having a generator, with their input replaced.
+def generated_days(days: list[Day], scale: float, seed: int,
+                   directory: str) -> list[Day]:
+    res = []
+    for d in days:
+        if d.name not in GENERATORS:
+            continue
+        path = os.path.join(directory, f"{d.year}_{d.day}")
+        with open(path, "w") as fd:
+            fd.write(generate(d.name, scale, seed))
+        res.append(Day(d.year, d.day, d.script, path))
+    return res
+
+# Names of the function parsing the input, in order of preference.
+PARSE_NAMES = ["parse", "parseInput"]
+
+# Names of the functions solving each part.
+PART_NAMES = ["part1", "part2"]
+
+# Check if a solve.py exposes part functions that can be called individually,
+# i.e. if it can be imported without running the solution. Days for which part
+# 2 was never solved only expose part1.
+def has_part_functions(script: str) -> bool:
+    tree = ast.parse(open(script, "r").read(), script)
+    names = {n.name for n in tree.body if isinstance(n, ast.FunctionDef)}
+    return "part1" in names
+
+# Import a solve.py as a module. The module is named after its path from the
+# root of the repository, e.g. "2022.1.solve", and registered in sys.modules
+# like a regular import: the functions of the day can then be pickled, e.g. to
+# be sent to worker processes, which can import the module by that name.
+def load_module(day: Day):
+    name = f"{day.year}.{day.day}.solve"
+    spec = importlib.util.spec_from_file_location(name, day.script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    # Some days import helpers living next to their solve.py.
+    sys.path.insert(0, os.path.dirname(day.script))
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    finally:
+        sys.path.pop(0)
+    return module
+
+# Run a function once and measure it.
+# @return: A tuple (result, wall time, cpu time).
+def timed(func: Callable, *args) -> tuple[Any, float, float]:
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    res = func(*args)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    return res, wall, cpu
+
+# Run a function once under tracemalloc.
+# @return: The peak of memory allocated while running the function, in bytes.
+def traced(func: Callable, *args) -> int:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# Benchmark a single phase.
+# @param phase: Name of the phase.
+# @param runs: Number of timed runs.
+# @param memory: If True, do an extra run to measure the peak memory.
+# @param phases: If True, do an extra run recording the phases of the solution.
+# Their peak memory is measured if `memory` is True.
+# @param func, args: The function to benchmark and its arguments.
+def bench_phase(phase: str, runs: int, memory: bool, phases: bool,
+                func: Callable, *args):
+    res = PhaseResult(phase)
+    for _ in range(runs):
+        res.answer, wall, cpu = timed(func, *args)
+        res.wall.append(wall)
+        res.cpu.append(cpu)
+    if memory:
+        res.peak_mem = traced(func, *args)
+    if phases:
+        with recording(memory) as breakdown:
+            func(*args)
+        res.breakdown = breakdown
+    return res
+
+# Run a script doing all its work at module level, as if it was started from
+# the command line.
+# @return: The answers printed by the script, e.g. "12 / 34".
+def run_script(day: Day) -> str:
+    out = io.StringIO()
+    argv = sys.argv
+    sys.argv = [day.script, day.input]
+    sys.path.insert(0, os.path.dirname(day.script))
+    try:
+        with contextlib.redirect_stdout(out):
+            runpy.run_path(day.script, run_name="__main__")
+    finally:
+        sys.path.pop(0)
+        sys.argv = argv
+    answers = re.findall("Part [12]: (.*)", out.getvalue())
+    return " / ".join(answers)
+
+# Benchmark all the phases of a day.
+# @return: The list of PhaseResult for this day.
+def bench_day(day: Day, runs: int, memory: bool,
+              phases: bool = False) -> list[PhaseResult]:
+    # The solutions like to print progress and pictures, keep the output of the
+    # runner readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not has_part_functions(day.script):
+            return [bench_phase("script", runs, memory, phases, run_script,
+                                day)]
+        module = load_module(day)
+        parse = [getattr(module, n) for n in PARSE_NAMES if hasattr(module, n)]
+        parts = [(n, getattr(module, n)) for n in PART_NAMES \
+                 if hasattr(module, n)]
+        if len(parse) == 0:
+            return [bench_phase(n, runs, memory, phases, f, day.input) \
+                    for n, f in parts]
+        # Parse once, both parts are working on the same parsed input.
+        parse_phase = bench_phase("parse", runs, memory, phases, parse[0],
+                                  day.input)
+        data = parse_phase.answer
+        parse_phase.answer = None
+        return [parse_phase] + \
+            [bench_phase(n, runs, memory, phases, f, data) for n, f in parts]
+
+# Align the columns of a table.
+# @param rows: The rows of the table, header included, as tuples of strings.
+# @param left: Number of leading columns justified to the left, the others are
+# justified to the right. The last column is never padded.
+def align(rows: list[tuple[str, ...]], left: int) -> str:
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]) - 1)]
+    lines = []
+    for r in rows:
+        cols = [r[i].ljust(widths[i]) for i in range(left)]
+        cols += [r[i].rjust(widths[i]) for i in range(left, len(widths))]
+        lines.append("  ".join(cols + [r[-1]]))
+    return "\n".join(lines)
+
+# Answer of a phase as a table cell. A multi-line answer, e.g. the screen of
+# 2022/10, is only summarized.
+def format_answer(answer) -> str:
+    if answer is None:
+        return "-"
+    lines = str(answer).strip("\n").splitlines()
+    if len(lines) > 1:
+        return f"<{len(lines)} lines>"
+    return str(answer)
+
+# Format the results as a table.
+# @param results: List of (day, list of PhaseResult).
+def format_table(results: list[tuple[Day, list[PhaseResult]]]) -> str:
+    header = ("day", "phase", "wall ms", "cpu ms", "peak KiB", "answer")
+    rows = []
+    for day, phases in results:
+        for p in phases:
+            peak = "-" if p.peak_mem is None else f"{p.peak_mem / 1024:.0f}"
+            rows.append((day.name,
+                         p.phase,
+                         f"{statistics.median(p.wall) * 1000:.2f}",
+                         f"{statistics.median(p.cpu) * 1000:.2f}",
+                         peak,
+                         format_answer(p.answer)))
+    return align([header] + rows, 2)
+
+# Format the phases recorded with --phases as a table.
+# @param results: List of (day, list of PhaseResult).
+def format_breakdown(results: list[tuple[Day, list[PhaseResult]]]) -> str:
+    header = ("day", "phase", "breakdown", "calls", "wall ms", "peak KiB",
+              "blocks", "gc")
+    rows = []
+    for day, phases in results:
+        for p in phases:
+            for name, b in (p.breakdown or {}).items():
+                peak = "-" if b.peak_mem is None else f"{b.peak_mem / 1024:.0f}"
+                rows.append((day.name, p.phase, name, str(b.calls),
+                             f"{b.wall * 1000:.2f}", peak,
+                             str(b.alloc_blocks),
+                             "/".join(str(c) for c in b.gc_collections)))
+    return align([header] + rows, 3)
+
+# Convert the results to a JSON-serializable object.
+# @param scale, seed: Parameters of the generated inputs, None for the real
+# inputs.
+def to_json(results: list[tuple[Day, list[PhaseResult]]],
+            scale: float | None = None, seed: int | None = None) -> dict:
+    return {
+        "python": sys.version,
+        "scale": scale,
+        "seed": seed,
+        "days": [{
+            "day": day.name,
+            "script": os.path.relpath(day.script, ROOT),
+            # Generated inputs are deleted after the run.
+            "input": None if scale is not None \
+                else os.path.relpath(day.input, ROOT),
+            "input_bytes": os.path.getsize(day.input),
+            "phases": [p.to_json() for p in phases],
+        } for day, phases in results]
+    }
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark the solutions.")
+    parser.add_argument("days", nargs="*", metavar="DAY",
+                        help="YEAR or YEAR/DAY to run, default: all")
+    parser.add_argument("-n", "--runs", type=int, default=1,
+                        help="number of timed runs per phase")
+    parser.add_argument("--json", metavar="FILE",
+                        help="write the results as JSON into FILE")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the extra run measuring peak memory")
+    parser.add_argument("--phases", action="store_true",
+                        help="do an extra run recording the phases marked "
+                        "in the solutions")
+    parser.add_argument("--scale", type=float,
+                        help="run against generated inputs S times bigger "
+                        "than the real ones")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the generated inputs, default: 0")
+    args = parser.parse_args(argv)
+
+    days = select_days(find_days(), args.days)
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as tmp:
+        if args.scale is not None:
+            days = generated_days(days, args.scale, args.seed, tmp)
+        results = []
+        for day in days:
+            print(f"Running {day.name} ...", file=sys.stderr)
+            results.append((day, bench_day(day, args.runs,
+                                           not args.no_memory, args.phases)))
+        json_results = to_json(results, args.scale,
+                               None if args.scale is None else args.seed)
+
+    print(format_table(results))
+    if any(p.breakdown for _, phases in results for p in phases):
+        print()
+        print(format_breakdown(results))
+    if args.json is not None:
+        with open(args.json, "w") as fd:
+            json.dump(json_results, fd, indent=2)
+
+if __name__ == "__main__":
+    main()
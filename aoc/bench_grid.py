@@ -0,0 +1,156 @@
+#!/bin/python3
+
+# Micro-benchmark of the shared Grid (aoc/grid.py) against the list of lists
+# Grid that used to be copy-pasted in 2024/8, 2024/10 and 2024/12.
+#
+# Usage, from the root of the repository:
+#   python -m aoc.bench_grid [-n REPEAT] [--scale N] [FILE]
+# FILE defaults to the input of 2024/12. With --scale, the grid read from FILE
+# is tiled N times in each direction.
+
+import argparse
+import os
+import timeit
+from typing import Any
+
+from aoc.bench import ROOT
+from aoc.grid import Grid
+from aoc.position import Position
+
+# The Grid of 2024/8, 10 and 12 as it was before aoc/grid.py, reduced to the
+# methods exercised by the benchmark.
+class LegacyGrid:
+    def __init__(self, rows: list[list[Any]]):
+        prev_row_len = len(rows[0])
+        for i in range(1, len(rows)):
+            if len(rows[i]) != prev_row_len:
+                raise Exception("Not all rows have the same length")
+        self.rows = rows
+        self.width = prev_row_len
+        self.height = len(rows)
+
+    def find(self, value: Any) -> list[Position]:
+        return [Position(x, y) \
+                for y in range(len(self.rows)) \
+                for x in range(len(self.rows[y])) \
+                if self.rows[y][x] == value]
+
+    def values(self):
+        res = set()
+        for y in range(len(self.rows)):
+            for x in range(len(self.rows[y])):
+                res.add(self.rows[y][x])
+        return res
+
+    def __getitem__(self, index: Position | tuple[int, int]) -> Any:
+        if type(index) is Position:
+            x, y = index.x, index.y
+        else:
+            x, y = index
+        if self.in_bounds((x, y)):
+            return self.rows[y][x]
+        else:
+            raise Exception("Error: Grid indices out of range")
+
+    def __setitem__(self, index: Position | tuple[int, int], value: Any):
+        if type(index) is Position:
+            x, y = index.x, index.y
+        else:
+            x, y = index
+        if self.in_bounds((x, y)):
+            self.rows[y][x] = value
+        else:
+            raise Exception("Error: Grid indices out of range")
+
+    def in_bounds(self, index: Position | tuple[int, int]) -> bool:
+        if type(index) is Position:
+            x, y = index.x, index.y
+        else:
+            x, y = index
+        return 0 <= y < len(self.rows) and 0 <= x < len(self.rows[y])
+
+    def neighbors_of(self, pos: Position):
+        res = []
+        voff = [Position(-1, 0), Position(1, 0), Position(0, -1),
+                Position(0, 1)]
+        for off in voff:
+            npos = pos + off
+            if self.in_bounds(npos):
+                res.append(npos)
+        return res
+
+# Read the lines of a grid, tiled `scale` times in each direction.
+def read_lines(path: str, scale: int) -> list[str]:
+    fd = open(path, "r")
+    lines = [l.rstrip("\n") for l in fd if l != "\n"]
+    fd.close()
+    return [l * scale for l in lines] * scale
+
+# The operations to benchmark. Each one takes a grid and the list of all its
+# positions.
+def read_all(grid, positions):
+    for p in positions:
+        grid[p]
+
+def write_all(grid, positions):
+    for p in positions:
+        grid[p] = grid[p]
+
+def find_each_value(grid, positions):
+    # Write a cell first so that the new grid has to rebuild its value index,
+    # i.e. this measures the cost of the first find() after a modification.
+    grid[positions[0]] = grid[positions[0]]
+    for v in grid.values():
+        grid.find(v)
+
+def neighbors_all(grid, positions):
+    for p in positions:
+        grid.neighbors_of(p)
+
+# Same as neighbors_all + read_all, but the way a hot loop would do it with the
+# new grid: through the flat buffer and the precomputed neighbor indices.
+def neighbors_flat(grid, positions):
+    cells = grid.cells
+    for i, n in enumerate(grid.neighbor_indices()):
+        h = cells[i]
+        for j in n:
+            cells[j] == h
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark the Grid.")
+    parser.add_argument("file", nargs="?",
+                        default=os.path.join(ROOT, "2024", "12", "input.txt"),
+                        help="grid to benchmark on")
+    parser.add_argument("-n", "--repeat", type=int, default=5,
+                        help="number of runs, the best one is reported")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="tile the grid N times in each direction")
+    args = parser.parse_args(argv)
+
+    lines = read_lines(args.file, args.scale)
+    legacy = LegacyGrid([list(l) for l in lines])
+    grid = Grid(len(lines[0]), len(lines),
+                bytearray("".join(lines), "latin-1"), text=True)
+    positions = [Position(x, y) for y in range(grid.height) \
+                 for x in range(grid.width)]
+    print(f"{grid.width}x{grid.height} grid, best of {args.repeat} runs")
+
+    ops = [("read", read_all), ("write", write_all),
+           ("find", find_each_value), ("neighbors", neighbors_all)]
+    print(f"{'op':<16} {'legacy ms':>10} {'grid ms':>10} {'speedup':>8}")
+    def best(func, grid):
+        return min(timeit.repeat(lambda: func(grid, positions),
+                                 number=1, repeat=args.repeat))
+    for name, func in ops:
+        old = best(func, legacy)
+        new = best(func, grid)
+        print(f"{name:<16} {old * 1000:>10.2f} {new * 1000:>10.2f} "
+              f"{old / new:>7.1f}x")
+    # The legacy grid has no equivalent, compare against its neighbors_of.
+    old = best(neighbors_all, legacy)
+    new = best(neighbors_flat, grid)
+    print(f"{'neighbors flat':<16} {old * 1000:>10.2f} {new * 1000:>10.2f} "
+          f"{old / new:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
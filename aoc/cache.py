@@ -0,0 +1,153 @@
+#!/bin/python3
+
+# On-disk cache of the answers computed by the solutions.
+#
+# Entries are content-addressed: the key of an entry is a hash of the source of
+# the solve.py (and of the shared `aoc` modules it depends on, directly or not),
+# of the bytes of the input file, and of the name of the part. Editing a solver
+# or an input file therefore changes the key and the old entries are simply
+# never looked up again. Each entry is a small JSON file holding the answer and
+# the time it took to compute it.
+# The cache is bounded in size: once the entries take more than `max_bytes` on
+# disk, the least recently used ones are removed. Reading an entry bumps its
+# modification time, which is what is used to order the entries.
+
+import ast
+import hashlib
+import json
+import os
+from typing import Any
+
+from aoc.bench import ROOT
+
+# Default location of the cache, can be overridden with $AOC_CACHE_DIR.
+DEFAULT_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".cache"))
+
+# Default bound on the size of the cache, in bytes.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Find the modules of the shared `aoc` package imported directly by a script.
+# @param script: Path to the script.
+# @return: The set of paths to the imported modules.
+def aoc_imports(script: str) -> set[str]:
+    tree = ast.parse(open(script, "r").read(), script)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names |= {a.name for a in node.names}
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            names.add(node.module)
+            # from aoc import grid
+            names |= {f"{node.module}.{a.name}" for a in node.names}
+    res = set()
+    for n in names:
+        parts = n.split(".")
+        if parts[0] != "aoc" or len(parts) < 2:
+            continue
+        path = os.path.join(ROOT, "aoc", parts[1] + ".py")
+        if os.path.isfile(path):
+            res.add(path)
+    return res
+
+# Find the modules of the shared `aoc` package a script depends on, e.g. the
+# ones it imports, the ones they import, and so on.
+# @param script: Path to the script.
+# @return: The sorted list of paths to the modules.
+def aoc_dependencies(script: str) -> list[str]:
+    res = set()
+    todo = [script]
+    while len(todo):
+        for path in aoc_imports(todo.pop()):
+            if path not in res:
+                res.add(path)
+                todo.append(path)
+    return sorted(res)
+
+class AnswerCache:
+    # @param directory: Directory holding the entries, created if needed.
+    # @param max_bytes: Size above which the least recently used entries are
+    # evicted.
+    def __init__(self, directory: str = DEFAULT_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    # Compute the key of an entry.
+    # @param script: Path to the solve.py.
+    # @param input: Path to the input file.
+    # @param part: Name of the part, e.g. "part1".
+    # @return: The key, as an hexadecimal string.
+    @staticmethod
+    def key(script: str, input: str, part: str) -> str:
+        h = hashlib.sha256()
+        for path in [script] + aoc_dependencies(script) + [input]:
+            data = open(path, "rb").read()
+            # Prefix with the length so that the concatenation is unambiguous.
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+        h.update(part.encode())
+        return h.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    # Look up an entry.
+    # @param key: Key of the entry, see `key`.
+    # @return: The entry as a dict {"answer", "wall"}, None on a miss.
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self.path(key)
+        try:
+            fd = open(path, "r")
+            entry = json.load(fd)
+            fd.close()
+        except (OSError, ValueError):
+            return None
+        # Mark as recently used.
+        os.utime(path)
+        return entry
+
+    # Add or replace an entry, then evict the least recently used entries if the
+    # cache grew too big.
+    # @param key: Key of the entry, see `key`.
+    # @param answer: The answer. Stored as a string.
+    # @param wall: Time it took to compute the answer, in seconds.
+    def put(self, key: str, answer: Any, wall: float | None):
+        entry = {"answer": None if answer is None else str(answer),
+                 "wall": wall}
+        path = self.path(key)
+        # Write then rename so that a concurrent reader never sees a partial
+        # entry.
+        tmp = f"{path}.{os.getpid()}.tmp"
+        fd = open(tmp, "w")
+        json.dump(entry, fd)
+        fd.close()
+        os.replace(tmp, path)
+        self.evict()
+
+    # Remove the least recently used entries until the cache fits in
+    # `max_bytes`.
+    def evict(self):
+        entries = []
+        total = 0
+        for e in os.scandir(self.directory):
+            if not e.name.endswith(".json"):
+                continue
+            st = e.stat()
+            entries.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    # Remove all the entries.
+    def clear(self):
+        for e in os.scandir(self.directory):
+            if e.name.endswith(".json") or e.name.endswith(".tmp"):
+                os.remove(e.path)
@@ -0,0 +1,137 @@
+#!/bin/python3
+
+# Command line entry point shared by the days' solve.py.
+#
+# Usage of a day:
+#   python solve.py [--profile [--profile-prefix PREFIX] [--top N]] INPUT
+# or, from the root of the repository, e.g. `python -m 2022.7.solve INPUT`.
+# Run as a module, the day finds the shared `aoc` package on sys.path. Run as a
+# script (`__package__` is then empty), the day first adds the root of the
+# repository to sys.path.
+# The input is parsed and the answer of each part is printed as "Part N: ...",
+# a multi-line answer starting on the line after "Part N:".
+#
+# With --profile, each part runs under cProfile, the parsing being left out.
+# For each part, the profile is written into `PREFIX.partN.prof`, which can be
+# opened with pstats or snakeviz. The same profile is also written as collapsed
+# stacks into `PREFIX.partN.folded`, the input format of flamegraph.pl and
+# speedscope. The N functions with the highest cumulative time (20 by default)
+# are printed on stderr. PREFIX defaults to `YEAR_DAY-profile` in the current
+# directory.
+#
+# cProfile only records the caller -> callee edges, not the whole stacks. The
+# collapsed stacks are rebuilt by splitting the time of each function between
+# its callees in proportion of the time spent in each of them, as the flame
+# graph converters for cProfile do. The stacks of recursive functions are cut at
+# the first repetition.
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+from typing import Callable
+
+# Name of a function in the collapsed stacks. flamegraph.pl splits the stacks on
+# ";" and the counts on the last space.
+# @param func: A (filename, line, name) key of pstats.
+def frame_name(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Built-in, e.g. "<method 'append' of 'list' objects>".
+        res = name
+    else:
+        res = f"{name} ({os.path.basename(filename)}:{line})"
+    return res.replace(";", ",").replace(" ", "_")
+
+# Rebuild collapsed stacks from a profile.
+# @param stats: The pstats.Stats of the profile.
+# @param min_time: Stacks taking less than this time, in seconds, are dropped.
+# @return: A dict of "caller;callee;..." -> time spent in the last function of
+# the stack itself, in microseconds.
+def collapsed_stacks(stats: pstats.Stats,
+                     min_time: float = 1e-6) -> dict[str, int]:
+    # callees[f] = list of (callee, cumulative time of f spent in callee).
+    callees = {f: [] for f in stats.stats}
+    roots = []
+    for f, (_, _, _, _, callers) in stats.stats.items():
+        if len(callers) == 0:
+            roots.append(f)
+        for caller, (_, _, _, ct) in callers.items():
+            if caller in callees:
+                callees[caller].append((f, ct))
+    res = {}
+    # Walk the call graph from the roots, `share` being the time of this stack.
+    todo = [((r,), stats.stats[r][3]) for r in roots]
+    while len(todo):
+        stack, share = todo.pop()
+        f = stack[-1]
+        _, _, tt, ct, _ = stats.stats[f]
+        if ct <= 0:
+            continue
+        self_time = share * tt / ct
+        if self_time >= min_time:
+            key = ";".join(frame_name(s) for s in stack)
+            res[key] = res.get(key, 0) + round(self_time * 1e6)
+        for callee, edge_ct in callees[f]:
+            callee_share = share * edge_ct / ct
+            if callee not in stack and callee_share >= min_time:
+                todo.append((stack + (callee,), callee_share))
+    return res
+
+# Run a part under cProfile and write its profile.
+# @param func: The part to run.
+# @param data: The parsed input, passed to `func`.
+# @param prefix: Prefix of the files to write, see the top of this file.
+# @param top: Number of functions to print.
+# @return: The answer of the part.
+def profile(func: Callable, data, prefix: str, top: int):
+    profiler = cProfile.Profile()
+    res = profiler.runcall(func, data)
+    profiler.create_stats()
+    prof = f"{prefix}.{func.__name__}.prof"
+    folded = f"{prefix}.{func.__name__}.folded"
+    profiler.dump_stats(prof)
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    with open(folded, "w") as fd:
+        for stack, t in sorted(collapsed_stacks(stats).items()):
+            fd.write(f"{stack} {t}\n")
+    print(f"{func.__name__}: profile written into {prof} and {folded}",
+          file=sys.stderr)
+    stats.sort_stats("cumulative").print_stats(top)
+    return res
+
+# Run a day from the command line.
+# @param parse: Function parsing the input file.
+# @param part1: Function solving part 1 from the parsed input.
+# @param part2: (Optional) Function solving part 2 from the parsed input.
+# @param argv: Command line arguments, sys.argv[1:] by default.
+def run(parse: Callable, part1: Callable, part2: Callable = None,
+        argv: list[str] | None = None):
+    script = parse.__code__.co_filename
+    parser = argparse.ArgumentParser(prog=script)
+    parser.add_argument("input", help="input file")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile each part with cProfile")
+    parser.add_argument("--profile-prefix", metavar="PREFIX",
+                        help="prefix of the profile files")
+    parser.add_argument("--top", type=int, default=20, metavar="N",
+                        help="number of functions of the profile to print")
+    args = parser.parse_args(argv)
+
+    prefix = args.profile_prefix
+    if prefix is None:
+        path = os.path.dirname(os.path.abspath(script))
+        year, day = path.split(os.sep)[-2:]
+        prefix = f"{year}_{day}-profile"
+    data = parse(args.input)
+    parts = [part1] if part2 is None else [part1, part2]
+    for i, func in enumerate(parts):
+        if args.profile:
+            res = profile(func, data, prefix, args.top)
+        else:
+            res = func(data)
+        res = str(res)
+        # A multi-line answer, e.g. a screen, starts on its own line.
+        sep = "\n" if "\n" in res else " "
+        print(f"Part {i + 1}:{sep}{res}")
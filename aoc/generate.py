@@ -0,0 +1,820 @@
+#!/bin/python3
+
+# Generators of synthetic puzzle inputs, used to stress the solutions with
+# inputs much bigger than the real ones.
+#
+# Usage, from the root of the repository:
+#   python -m aoc.generate [--scale S] [--seed N] [-o FILE] DAY
+#   python -m aoc.generate --list
+# The benchmark runner can also run the days against generated inputs, see the
+# --scale option of aoc/bench.py.
+#
+# Each generator produces the content of an input file whose size is roughly
+# `scale` times the size of the real input: `scale` times more lines for the
+# line-oriented inputs, `scale` times the area for the grids. The output only
+# depends on the day, the scale and the seed.
+# The inputs are valid: they follow the format and the guarantees of the puzzle
+# that the solutions rely on (e.g. a single uncovered position for 2022/15 or a
+# guard leaving the map for 2024/6). A few days cannot grow as much as asked
+# and are documented as such: the puzzle format limits the number of valves of
+# 2022/16 and of monkeys of 2022/21, and the cube net of 2022/22 is fixed.
+
+import argparse
+import itertools
+import math
+import random
+import string
+import sys
+from typing import Callable
+
+# Registry of the generators, "YEAR/DAY" -> function(rng, scale) -> str.
+GENERATORS: dict[str, Callable[[random.Random, float], str]] = {}
+
+# Decorator registering a generator for a day.
+def generator(day: str):
+    def register(func):
+        GENERATORS[day] = func
+        return func
+    return register
+
+# Generate an input.
+# @param day: "YEAR/DAY" of the puzzle.
+# @param scale: Size of the input relative to the size of the real input.
+# @param seed: Seed of the random generator.
+# @return: The content of the input file.
+def generate(day: str, scale: float = 1, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise KeyError(f"No generator for {day}")
+    # String seeds are hashed with SHA-512, the inputs do not depend on
+    # PYTHONHASHSEED.
+    rng = random.Random(f"{day}/{scale}/{seed}")
+    return GENERATORS[day](rng, scale)
+
+# Number of elements of a line-oriented input.
+# @param base: Number of elements in the real input.
+def count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+# Side of a grid whose area grows linearly with the scale.
+# @param base: Side in the real input.
+def side(base: int, scale: float) -> int:
+    return max(1, round(base * math.sqrt(scale)))
+
+def lines(rows) -> str:
+    return "".join(r + "\n" for r in rows)
+
+# 2022 ------------------------------------------------------------------------
+
+@generator("2022/1")
+def calories(rng, scale):
+    elves = []
+    for _ in range(count(250, scale)):
+        n = rng.randint(1, 15)
+        elves.append([str(rng.randint(1000, 60000)) for _ in range(n)])
+    return "\n\n".join("\n".join(e) for e in elves) + "\n"
+
+@generator("2022/2")
+def rock_paper_scissors(rng, scale):
+    return lines(f"{rng.choice('ABC')} {rng.choice('XYZ')}" \
+                 for _ in range(count(2500, scale)))
+
+# Generate a rucksack containing `badge` and in which a single item is in both
+# compartments. `excluded` items are not put in the rucksack.
+def rucksack(rng, badge: str, excluded: set[str]) -> str:
+    pool = [c for c in string.ascii_letters if c not in excluded]
+    shared = rng.choice(pool)
+    others = rng.sample([c for c in pool if c != shared], rng.randint(4, 16))
+    split = rng.randint(1, len(others) - 1)
+    left, right = others[:split], others[split:]
+    if badge != shared and badge not in others:
+        left.append(badge)
+    n = rng.randint(max(len(left), len(right)) + 1, 24)
+    def compartment(items):
+        res = [shared] + items
+        res += rng.choices(res, k=n - len(res))
+        rng.shuffle(res)
+        return "".join(res)
+    return compartment(left) + compartment(right)
+
+@generator("2022/3")
+def rucksacks(rng, scale):
+    res = []
+    for _ in range(count(100, scale)):
+        badge = rng.choice(string.ascii_letters)
+        r1 = rucksack(rng, badge, set())
+        r2 = rucksack(rng, badge, set())
+        # The badge must be the only item common to the three rucksacks.
+        r3 = rucksack(rng, badge, (set(r1) & set(r2)) - {badge})
+        res += [r1, r2, r3]
+    return lines(res)
+
+@generator("2022/4")
+def section_pairs(rng, scale):
+    def assignment():
+        a = rng.randint(1, 99)
+        return f"{a}-{rng.randint(a, 99)}"
+    return lines(f"{assignment()},{assignment()}" \
+                 for _ in range(count(1000, scale)))
+
+@generator("2022/5")
+def crates(rng, scale):
+    num_stacks = 9
+    height = max(2, count(8, scale))
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(2, height)) \
+              for _ in range(num_stacks)]
+    res = []
+    for level in range(max(len(s) for s in stacks) - 1, -1, -1):
+        res.append(" ".join(f"[{s[level]}]" if level < len(s) else "   " \
+                            for s in stacks))
+    res.append(" " + "   ".join(str(i + 1) for i in range(num_stacks)) + " ")
+    res.append("")
+    # Simulate the moves so that they never take more crates than available,
+    # and never empty a stack: the answer is the crate on top of each stack.
+    sizes = [len(s) for s in stacks]
+    for _ in range(count(500, scale)):
+        src = rng.choice([i for i in range(num_stacks) if sizes[i] > 1])
+        dst = rng.choice([i for i in range(num_stacks) if i != src])
+        n = rng.randint(1, min(sizes[src] - 1, 30))
+        sizes[src] -= n
+        sizes[dst] += n
+        res.append(f"move {n} from {src + 1} to {dst + 1}")
+    return lines(res)
+
+@generator("2022/6")
+def datastream(rng, scale):
+    n = count(4096, scale)
+    # No 4 distinct characters in a row for the first 40% of the stream, no 14
+    # distinct characters until 90%, so that both markers are found late.
+    res = rng.choices("abc", k=int(n * 0.4))
+    res += rng.choices("abcdefghijklm", k=int(n * 0.9) - len(res))
+    res += rng.sample(string.ascii_lowercase, 14)
+    res += rng.choices(string.ascii_lowercase, k=max(0, n - len(res)))
+    return "".join(res) + "\n"
+
+@generator("2022/7")
+def filesystem(rng, scale):
+    def name():
+        return "".join(rng.choices(string.ascii_lowercase,
+                                   k=rng.randint(1, 8)))
+    # children[i] is the list of sub-directories of directory i, files[i] its
+    # list of (name, weight).
+    children = [[]]
+    files = [[]]
+    for i in range(1, count(190, scale)):
+        parent = rng.randrange(i)
+        children.append([])
+        files.append([])
+        children[parent].append(i)
+    for _ in range(count(330, scale)):
+        files[rng.randrange(len(files))].append(rng.random())
+    # Make the total size a bit over the 40000000 the puzzle needs to have to
+    # delete a directory.
+    total = rng.randint(41000000, 49000000)
+    weights = sum(w for f in files for w in f)
+    res = ["$ cd /"]
+    def visit(d, names):
+        res.append("$ ls")
+        used = set()
+        entries = []
+        for c in children[d]:
+            n = name()
+            while n in used:
+                n = name()
+            used.add(n)
+            entries.append(n)
+            res.append(f"dir {n}")
+        for w in files[d]:
+            n = name()
+            while n in used:
+                n = name()
+            used.add(n)
+            if rng.random() < 0.5:
+                n += "." + rng.choice(["txt", "dat", "log", "bin"])
+            res.append(f"{max(1, int(w * total / weights))} {n}")
+        for c, n in zip(children[d], entries):
+            res.append(f"$ cd {n}")
+            visit(c, names + [n])
+            res.append("$ cd ..")
+    visit(0, [])
+    return lines(res)
+
+@generator("2022/8")
+def trees(rng, scale):
+    n = side(99, scale)
+    return lines("".join(rng.choices(string.digits, k=n)) for _ in range(n))
+
+@generator("2022/9")
+def rope_motions(rng, scale):
+    return lines(f"{rng.choice('RLUD')} {rng.randint(1, 19)}" \
+                 for _ in range(count(2000, scale)))
+
+@generator("2022/10")
+def cpu_program(rng, scale):
+    res = []
+    cycles = 0
+    x = 1
+    # The CRT needs at least 240 cycles.
+    while len(res) < count(137, scale) or cycles < 240:
+        if rng.random() < 0.25:
+            res.append("noop")
+            cycles += 1
+        else:
+            # Keep the sprite on the screen.
+            v = rng.choice([v for v in range(-20, 21) \
+                            if v != 0 and 0 <= x + v < 40])
+            x += v
+            res.append(f"addx {v}")
+            cycles += 2
+    return lines(res)
+
+# The first `n` prime numbers.
+def primes(n: int) -> list[int]:
+    res = []
+    i = 2
+    while len(res) < n:
+        if all(i % p for p in res if p * p <= i):
+            res.append(i)
+        i += 1
+    return res
+
+@generator("2022/11")
+def monkeys(rng, scale):
+    # A monkey throws to two other monkeys.
+    n = max(3, count(8, scale))
+    divisors = primes(n)
+    rng.shuffle(divisors)
+    res = []
+    for i in range(n):
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))]
+        if i == 0:
+            op = "old * old"
+        elif rng.random() < 0.5:
+            op = f"old * {rng.randint(2, 19)}"
+        else:
+            op = f"old + {rng.randint(1, 8)}"
+        t, f = rng.sample([j for j in range(n) if j != i], 2)
+        res += [f"Monkey {i}:",
+                f"  Starting items: {', '.join(items)}",
+                f"  Operation: new = {op}",
+                f"  Test: divisible by {divisors[i]}",
+                f"    If true: throw to monkey {t}",
+                f"    If false: throw to monkey {f}",
+                ""]
+    return lines(res[:-1])
+
+@generator("2022/12")
+def heightmap(rng, scale):
+    height = side(41, scale)
+    # The ramp needs at least one column per elevation.
+    width = max(26, side(161, scale))
+    row = rng.randrange(height)
+    res = []
+    for y in range(height):
+        r = []
+        for x in range(width):
+            h = x * 26 // width
+            # Keep `row` untouched, it is a path from S to E. Elsewhere, lower
+            # some cells: it is always possible to step down.
+            if y != row and rng.random() < 0.3:
+                h = rng.randint(0, h)
+            r.append(chr(ord("a") + h))
+        res.append(r)
+    res[row][0] = "S"
+    res[row][-1] = "E"
+    return lines("".join(r) for r in res)
+
+def packet(rng, depth: int) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+@generator("2022/13")
+def packets(rng, scale):
+    pairs = []
+    for _ in range(count(150, scale)):
+        left = packet(rng, 0)
+        right = packet(rng, 0)
+        # Pairs are never equal in the puzzle.
+        while right == left:
+            right = packet(rng, 0)
+        pairs.append(f"{left}\n{right}")
+    return "\n\n".join(pairs) + "\n"
+
+@generator("2022/14")
+def rock_paths(rng, scale):
+    half_width = side(60, scale)
+    depth = side(170, scale)
+    res = []
+    for _ in range(count(138, scale)):
+        x = rng.randint(500 - half_width, 500 + half_width)
+        y = rng.randint(10, depth)
+        vertices = [f"{x},{y}"]
+        horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 5)):
+            d = rng.choice([-1, 1]) * rng.randint(1, 8)
+            if horizontal:
+                x += d
+            else:
+                # Stay below the source of the sand.
+                y = max(1, y + d)
+            horizontal = not horizontal
+            vertices.append(f"{x},{y}")
+        res.append(" -> ".join(vertices))
+    return lines(res)
+
+@generator("2022/15")
+def sensors(rng, scale):
+    limit = 4000000
+    # The sensors are built in the rotated coordinates u = x + y, v = x - y in
+    # which the area covered by a sensor of radius r is the square
+    # [u - r, u + r] x [v - r, v + r]. A sensor is at integer coordinates iff
+    # its u and v have the same parity.
+    # The area is covered by a lattice of such squares, overlapping by one,
+    # except for the squares containing the distress beacon P. The hole left is
+    # covered by 4 bigger squares whose sides are just next to P, which leaves P
+    # as the only uncovered position.
+    r = max(2, round(500000 / math.sqrt(scale)))
+    px, py = rng.randint(100000, limit - 100000), rng.randint(100000,
+                                                            limit - 100000)
+    pu, pv = px + py, px - py
+    u0 = rng.randrange(2 * r)
+    v0 = u0 + 2 * r * rng.randrange(2)
+    centers = []
+    for su in range(u0 - 2 * r, 2 * limit + 2 * r, 2 * r):
+        for sv in range(v0 - limit - 2 * r, limit + 2 * r, 2 * r):
+            if abs(su - pu) <= r and abs(sv - pv) <= r:
+                continue
+            x, y = (su + sv) // 2, (su - sv) // 2
+            if -r <= x <= limit + r and -r <= y <= limit + r:
+                centers.append((su, sv, r))
+    # The hole is within 2r of P, the sides of the 4 squares are at 1 from P.
+    # The radius must be odd for the centers to have integer coordinates.
+    big = 2 * r + 1
+    centers += [(pu - 1 - big, pv, big), (pu + 1 + big, pv, big),
+                (pu, pv - 1 - big, big), (pu, pv + 1 + big, big)]
+    rng.shuffle(centers)
+    res = []
+    for su, sv, radius in centers:
+        x, y = (su + sv) // 2, (su - sv) // 2
+        # Put the beacon anywhere on the edge of the covered area.
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice([-1, 1])
+        res.append(f"Sensor at x={x}, y={y}: closest beacon is at " \
+                   f"x={x + dx}, y={y + dy}")
+    return lines(res)
+
+@generator("2022/16")
+def valves(rng, scale):
+    # Valve names are two letters, the graph cannot grow beyond 676 valves.
+    # The search is exponential in the number of valves with a non-zero flow
+    # rate, only the number of valves with no flow grows with the scale.
+    names = ["".join(p) for p in \
+             itertools.product(string.ascii_uppercase, repeat=2)]
+    names.remove("AA")
+    n = min(len(names) + 1, max(16, count(62, scale)))
+    names = ["AA"] + rng.sample(names, n - 1)
+    rates = [0] * n
+    for i in rng.sample(range(1, n), 15):
+        rates[i] = rng.randint(3, 25)
+    # A random spanning tree keeps the graph connected, plus a few more
+    # tunnels.
+    tunnels = [set() for _ in range(n)]
+    order = list(range(n))
+    rng.shuffle(order)
+    for i in range(1, n):
+        a, b = order[i], order[rng.randrange(i)]
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    for _ in range(n // 4):
+        a, b = rng.sample(range(n), 2)
+        if len(tunnels[a]) < 5 and len(tunnels[b]) < 5:
+            tunnels[a].add(b)
+            tunnels[b].add(a)
+    res = []
+    for i in range(n):
+        dst = [names[j] for j in tunnels[i]]
+        rng.shuffle(dst)
+        if len(dst) == 1:
+            lead = f"tunnel leads to valve {dst[0]}"
+        else:
+            lead = f"tunnels lead to valves {', '.join(dst)}"
+        res.append(f"Valve {names[i]} has flow rate={rates[i]}; {lead}")
+    rng.shuffle(res)
+    return lines(res)
+
+@generator("2022/17")
+def jets(rng, scale):
+    return "".join(rng.choices("<>", k=count(10091, scale))) + "\n"
+
+@generator("2022/18")
+def cubes(rng, scale):
+    n = max(2, round(20 * scale ** (1 / 3)))
+    num = min(count(2801, scale), int(n ** 3 * 0.35))
+    res = []
+    for c in rng.sample(range(n ** 3), num):
+        z, c = divmod(c, n * n)
+        y, x = divmod(c, n)
+        res.append(f"{x},{y},{z}")
+    return lines(res)
+
+@generator("2022/19")
+def blueprints(rng, scale):
+    res = []
+    for i in range(count(30, scale)):
+        res.append(f"Blueprint {i + 1}: " \
+                   f"Each ore robot costs {rng.randint(2, 4)} ore. " \
+                   f"Each clay robot costs {rng.randint(2, 4)} ore. " \
+                   f"Each obsidian robot costs {rng.randint(2, 4)} ore and " \
+                   f"{rng.randint(5, 20)} clay. " \
+                   f"Each geode robot costs {rng.randint(2, 4)} ore and " \
+                   f"{rng.randint(7, 20)} obsidian.")
+    return lines(res)
+
+@generator("2022/20")
+def encrypted_file(rng, scale):
+    n = count(5000, scale)
+    # There must be a single 0.
+    res = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(n - 1)]
+    res.insert(rng.randint(0, n - 1), 0)
+    return lines(str(v) for v in res)
+
+@generator("2022/21")
+def math_monkeys(rng, scale):
+    # Names are 4 letters, which bounds the number of monkeys.
+    num_names = 26 ** 4
+    num_leaves = min((num_names - 2) // 2, (count(2049, scale) + 1) // 2)
+    def name(i):
+        res = ""
+        for _ in range(4):
+            i, c = divmod(i, 26)
+            res += string.ascii_lowercase[c]
+        return res
+    names = (name(i) for i in rng.sample(range(num_names), 2 * num_leaves + 2))
+    names = (n for n in names if n not in ("root", "humn"))
+    res = []
+    humn = None
+    # Build a tree with `leaves` leaves evaluating to `value`. The values are
+    # chosen top-down so that all the divisions are exact. If `has_humn`, humn
+    # is one of the leaves and only +, - and * are used on its path so that the
+    # tree stays exact whatever humn yells.
+    def build(leaves: int, value: int, has_humn: bool, name: str):
+        nonlocal humn
+        if leaves == 1:
+            if has_humn:
+                humn = value
+            else:
+                res.append(f"{name}: {value}")
+            return
+        left_leaves = rng.randint(1, leaves - 1)
+        humn_left = has_humn and rng.random() < 0.5
+        humn_right = has_humn and not humn_left
+        ops = ["-"]
+        if value >= 2:
+            ops.append("+")
+        divisors = [d for d in range(2, 20) if value % d == 0]
+        if len(divisors):
+            ops.append("*")
+        if not has_humn and value < 10 ** 12:
+            ops.append("/")
+        op = rng.choice(ops)
+        if op == "+":
+            a = rng.randint(1, value - 1)
+            b = value - a
+        elif op == "-":
+            b = rng.randint(1, 1000)
+            a = value + b
+        elif op == "*":
+            a = rng.choice(divisors)
+            b = value // a
+            if rng.random() < 0.5:
+                a, b = b, a
+        else:
+            b = rng.randint(2, 19)
+            a = value * b
+        left = "humn" if humn_left and left_leaves == 1 else next(names)
+        right = "humn" if humn_right and leaves - left_leaves == 1 \
+            else next(names)
+        res.append(f"{name}: {left} {op} {right}")
+        build(left_leaves, a, humn_left, left)
+        build(leaves - left_leaves, b, humn_right, right)
+    # For part 2 both sides of root are equal when humn yells the answer.
+    value = rng.randint(10 ** 6, 10 ** 10)
+    left_leaves = rng.randint(1, num_leaves - 1) if num_leaves > 2 else 1
+    left, right = next(names), next(names)
+    res.append(f"root: {left} + {right}")
+    build(left_leaves, value, True, left)
+    build(max(1, num_leaves - left_leaves), value, False, right)
+    res.append(f"humn: {humn + rng.randint(1, 1000)}")
+    rng.shuffle(res)
+    return lines(res)
+
+@generator("2022/22")
+def monkey_map(rng, scale):
+    # The solution hard-codes the cube net of the real input with faces of 50x50
+    # tiles, only the path grows with the scale.
+    size = 50
+    # Faces of the net, in units of `size`, for each row of faces.
+    net = [(1, 3), (1, 2), (0, 2), (0, 1)]
+    res = []
+    for start, end in net:
+        for _ in range(size):
+            row = ["#" if rng.random() < 0.1 else "." \
+                   for _ in range((end - start) * size)]
+            res.append(" " * (start * size) + "".join(row))
+    # The path starts on the leftmost open tile of the top row.
+    res[0] = res[0][:size] + "." + res[0][size + 1:]
+    path = str(rng.randint(1, 50))
+    for _ in range(count(2000, scale)):
+        path += rng.choice("LR") + str(rng.randint(1, 50))
+    return lines(res + ["", path])
+
+@generator("2022/23")
+def elves(rng, scale):
+    n = side(74, scale)
+    return lines("".join(rng.choices("#.", k=n)) for _ in range(n))
+
+@generator("2022/24")
+def blizzard_valley(rng, scale):
+    # The blizzards repeat every lcm(width, height) minutes and the solution
+    # precomputes all these states: grow both dimensions by the same factor to
+    # keep the period proportional to the side of the valley.
+    k = max(1, round(math.sqrt(scale)))
+    width, height = 100 * k, 35 * k
+    res = ["#." + "#" * width]
+    for y in range(height):
+        row = []
+        for x in range(width):
+            if rng.random() < 0.75:
+                # No vertical blizzards in the columns of the entrance and
+                # the exit.
+                dirs = "<>" if x in (0, width - 1) else "<>^v"
+                row.append(rng.choice(dirs))
+            else:
+                row.append(".")
+        res.append("#" + "".join(row) + "#")
+    res.append("#" * width + ".#")
+    return lines(res)
+
+def to_snafu(n: int) -> str:
+    res = ""
+    while n:
+        n, r = divmod(n, 5)
+        if r > 2:
+            r -= 5
+            n += 1
+        res = "=-012"[r + 2] + res
+    return res or "0"
+
+@generator("2022/25")
+def snafu_numbers(rng, scale):
+    return lines(to_snafu(rng.randint(1, 5 ** rng.randint(1, 19))) \
+                 for _ in range(count(125, scale)))
+
+# 2024 ------------------------------------------------------------------------
+
+@generator("2024/1")
+def location_lists(rng, scale):
+    return lines(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}" \
+                 for _ in range(count(1000, scale)))
+
+@generator("2024/2")
+def reports(rng, scale):
+    res = []
+    for _ in range(count(1000, scale)):
+        direction = rng.choice([-1, 1])
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        # Make about half of the reports unsafe.
+        if rng.random() < 0.5:
+            i = rng.randrange(len(levels))
+            levels[i] = max(1, levels[i] + rng.choice([-4, -1, 0, 2, 5]))
+        res.append(" ".join(str(l) for l in levels))
+    return lines(res)
+
+@generator("2024/3")
+def corrupted_memory(rng, scale):
+    noise = string.ascii_letters + string.digits + "()[]{}<>,'%#$@!*^&+-:;?/ "
+    res = []
+    for _ in range(count(6, scale)):
+        line = ""
+        while len(line) < 3000:
+            p = rng.random()
+            if p < 0.05:
+                line += f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+            elif p < 0.07:
+                # Corrupted instructions.
+                line += rng.choice([f"mul({rng.randint(1, 999)} ,1)",
+                                    f"mul[{rng.randint(1, 999)},2]",
+                                    f"mul ( 3,{rng.randint(1, 999)})"])
+            elif p < 0.075:
+                line += rng.choice(["do()", "don't()"])
+            else:
+                line += rng.choice(noise)
+        res.append(line)
+    return lines(res)
+
+@generator("2024/4")
+def word_search(rng, scale):
+    n = side(140, scale)
+    return lines("".join(rng.choices("XMAS", k=n)) for _ in range(n))
+
+@generator("2024/5")
+def print_queue(rng, scale):
+    window = 25
+    num_pages = max(window, count(49, scale))
+    pages = rng.sample(range(10, max(100, 10 + 2 * num_pages)), num_pages)
+    # Order rules between all the pages close enough in the order, hence the
+    # pages of an update taken from a window of the order are totally ordered.
+    rules = [f"{pages[i]}|{pages[j]}" for i in range(num_pages) \
+             for j in range(i + 1, min(num_pages, i + window))]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(count(201, scale)):
+        start = rng.randint(0, num_pages - window)
+        m = rng.choice(range(5, window, 2))
+        update = [pages[i] for i in sorted(rng.sample(range(start,
+                                                            start + window),
+                                                      m))]
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(",".join(str(p) for p in update))
+    return lines(rules + [""] + updates)
+
+# Check if the guard of a 2024/6 map leaves the map.
+def guard_leaves(grid: list[list[str]], x: int, y: int) -> bool:
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= ny < len(grid) and 0 <= nx < len(grid[ny])):
+            return True
+        if grid[ny][nx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+@generator("2024/6")
+def guard_map(rng, scale):
+    n = side(130, scale)
+    while True:
+        grid = [["#" if rng.random() < 0.05 else "." for _ in range(n)] \
+                for _ in range(n)]
+        x, y = rng.randrange(n), rng.randrange(n)
+        grid[y][x] = "^"
+        if guard_leaves(grid, x, y):
+            return lines("".join(r) for r in grid)
+
+@generator("2024/7")
+def calibrations(rng, scale):
+    res = []
+    for _ in range(count(850, scale)):
+        operands = [rng.randint(1, 9) if rng.random() < 0.6 \
+                    else rng.randint(10, 999) \
+                    for _ in range(rng.randint(2, 11))]
+        target = operands[0]
+        for o in operands[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                target += o
+            elif op == "*":
+                target *= o
+            else:
+                target = int(f"{target}{o}")
+        # About half of the equations cannot be made true.
+        if rng.random() < 0.5:
+            target += rng.randint(1, 1000)
+        res.append(f"{target}: {' '.join(str(o) for o in operands)}")
+    return lines(res)
+
+@generator("2024/8")
+def antennas(rng, scale):
+    n = side(50, scale)
+    symbols = string.ascii_letters + string.digits
+    freqs = rng.sample(symbols, min(len(symbols), count(60, scale)))
+    grid = [["."] * n for _ in range(n)]
+    cells = rng.sample(range(n * n), min(n * n, count(240, scale)))
+    for c in cells:
+        y, x = divmod(c, n)
+        grid[y][x] = rng.choice(freqs)
+    return lines("".join(r) for r in grid)
+
+@generator("2024/9")
+def disk_map(rng, scale):
+    n = count(9999, scale)
+    # Alternate files and free spaces, ending with a file.
+    res = []
+    for _ in range(n):
+        res.append(str(rng.randint(1, 9)))
+        res.append(str(rng.randint(0, 9)))
+    res.append(str(rng.randint(1, 9)))
+    return "".join(res) + "\n"
+
+@generator("2024/10")
+def topographic_map(rng, scale):
+    n = side(55, scale)
+    # Hills around random summits: the height of a cell is 9 minus its distance
+    # to the closest summit, so that there are trails from 0 to 9 on every
+    # slope. Cells too far from a summit are noise.
+    grid = [[None] * n for _ in range(n)]
+    frontier = []
+    for c in rng.sample(range(n * n), min(n * n, count(60, scale))):
+        y, x = divmod(c, n)
+        grid[y][x] = 9
+        frontier.append((x, y))
+    for h in range(8, -1, -1):
+        next_frontier = []
+        for x, y in frontier:
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < n and 0 <= ny < n and grid[ny][nx] is None:
+                    grid[ny][nx] = h
+                    next_frontier.append((nx, ny))
+        frontier = next_frontier
+    for r in grid:
+        for x in range(n):
+            # Break some of the trails.
+            if r[x] is None or rng.random() < 0.05:
+                r[x] = rng.randint(0, 9)
+    return lines("".join(str(h) for h in r) for r in grid)
+
+@generator("2024/11")
+def stones(rng, scale):
+    return " ".join(str(rng.randint(0, 99) if rng.random() < 0.5 \
+                        else rng.randint(100, 9999999)) \
+                    for _ in range(count(8, scale))) + "\n"
+
+@generator("2024/12")
+def garden(rng, scale):
+    n = side(140, scale)
+    grid = [[None] * n for _ in range(n)]
+    # Grow the regions from random seeds, picking the next plot to grow at
+    # random among the frontier so that the regions have irregular shapes.
+    frontier = []
+    for c in rng.sample(range(n * n), min(n * n, count(600, scale))):
+        y, x = divmod(c, n)
+        grid[y][x] = rng.choice(string.ascii_uppercase)
+        frontier.append((x, y))
+    while len(frontier):
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        x, y = frontier.pop()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < n and 0 <= ny < n and grid[ny][nx] is None:
+                grid[ny][nx] = grid[y][x]
+                frontier.append((nx, ny))
+    return lines("".join(r) for r in grid)
+
+@generator("2024/13")
+def claw_machines(rng, scale):
+    res = []
+    for _ in range(count(320, scale)):
+        ax, ay = rng.randint(10, 99), rng.randint(10, 99)
+        bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        # About half of the prizes can be won.
+        if rng.random() < 0.5:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        res.append(f"Button A: X+{ax}, Y+{ay}\n" \
+                   f"Button B: X+{bx}, Y+{by}\n" \
+                   f"Prize: X={px}, Y={py}")
+    return "\n\n".join(res) + "\n"
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate puzzle inputs.")
+    parser.add_argument("day", nargs="?", metavar="DAY",
+                        help="YEAR/DAY to generate the input of")
+    parser.add_argument("--scale", type=float, default=1,
+                        help="size relative to the real input, default: 1")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random generator, default: 0")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="write the input into FILE instead of stdout")
+    parser.add_argument("--list", action="store_true",
+                        help="list the days having a generator")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(GENERATORS.keys()))
+        return
+    if args.day is None:
+        parser.error("DAY is required")
+    data = generate(args.day.strip("/"), args.scale, args.seed)
+    if args.output is None:
+        sys.stdout.write(data)
+    else:
+        with open(args.output, "w") as fd:
+            fd.write(data)
+
+if __name__ == "__main__":
+    main()
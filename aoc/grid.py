@@ -0,0 +1,262 @@
+#!/bin/python3
+
+# 2D grid of small integers, shared by the days working on grids.
+#
+# The cells are stored row-major in a single flat buffer: a bytearray by
+# default, or an array.array for values that do not fit in a byte. The cell at
+# (x, y) is at index `y * width + x`. Grids parsed from a file without a
+# value_map hold the code of each character, e.g. ord("."), so that any text
+# grid fits in a bytearray. Booleans are stored as 0 and 1.
+#
+# On top of the usual position-based accessors, the grid offers what hot loops
+# need to avoid paying for bounds checks and Position objects:
+#   - `cells` is the flat buffer itself and can be indexed directly.
+#   - `index(pos)` and `position(i)` convert between positions and indices.
+#   - `neighbor_indices()` returns, for every cell, the indices of its in-bounds
+#     neighbors. This is computed once per grid.
+#   - `find(value)` is answered from an index of value -> positions, built on
+#     the first call and dropped whenever the grid is modified.
+# If NumPy is installed, `numpy_view()` returns a 2D array sharing the buffer of
+# the grid.
+
+from array import array
+from typing import Callable
+
+from aoc.position import Position
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class Grid:
+    # Create a grid from a flat buffer.
+    # @param width: Width of the grid.
+    # @param height: Height of the grid.
+    # @param cells: Row-major buffer of width * height cells, either a bytearray
+    # or an array.array. This buffer is NOT copied.
+    # @param text: If True, the cells are character codes and the grid is
+    # printed as text.
+    def __init__(self, width: int, height: int, cells: bytearray | array,
+                 text: bool = False):
+        if len(cells) != width * height:
+            raise ValueError("Grid size does not match the number of cells")
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.text = text
+        # Lazily built, see find() and neighbor_indices().
+        self._value_index = None
+        self._neighbors = None
+
+    # Create a buffer of `size` cells all set to `value`.
+    @staticmethod
+    def _buffer(size: int, value: int, typecode: str) -> bytearray | array:
+        if typecode == "B":
+            return bytearray([value]) * size
+        return array(typecode, [value]) * size
+
+    # Create a grid with the given dimension in which all cells have the same
+    # value.
+    # @param width: Width of the Grid.
+    # @param height: Height of the Grid.
+    # @param value: Value to initialize all cells to.
+    # @param typecode: array typecode of the cells, "B" uses a bytearray.
+    @staticmethod
+    def fill(width: int, height: int, value: int, typecode: str = "B"):
+        return Grid(width, height, Grid._buffer(width * height, value,
+                                                typecode))
+
+    # Create a grid from a 2D list.
+    # @param rows: The 2D list to create the grid from.
+    # @param typecode: array typecode of the cells, "B" uses a bytearray.
+    @staticmethod
+    def from_rows(rows: list[list[int]], typecode: str = "B"):
+        width = len(rows[0])
+        if any(len(r) != width for r in rows):
+            raise ValueError("Not all rows have the same length")
+        flat = [v for r in rows for v in r]
+        if typecode == "B":
+            return Grid(width, len(rows), bytearray(flat))
+        return Grid(width, len(rows), array(typecode, flat))
+
+    # Parse a grid from a text file.
+    # @param filename: Path to the text file to parse the grid from.
+    # @param value_map: (Optional) Function to map the characters of the file
+    # into an integer value. Called for each cell/position of the grid. If
+    # omitted, the cells hold the code of the characters.
+    # @param typecode: array typecode of the cells, "B" uses a bytearray.
+    # @return: The Grid corresponding to the contents of the file.
+    @staticmethod
+    def from_file(filename: str, value_map: Callable[[str], int] = None,
+                  typecode: str = "B"):
+        fd = open(filename, "r")
+        rows = [l.rstrip("\n") for l in fd]
+        fd.close()
+        while len(rows) and rows[-1] == "":
+            rows.pop()
+        width = len(rows[0])
+        if any(len(r) != width for r in rows):
+            raise ValueError("Not all rows have the same length")
+        if value_map is None and typecode == "B":
+            cells = bytearray("".join(rows), "latin-1")
+            return Grid(width, len(rows), cells, text=True)
+        if value_map is None:
+            value_map = ord
+        flat = [value_map(c) for r in rows for c in r]
+        if typecode == "B":
+            return Grid(width, len(rows), bytearray(flat))
+        return Grid(width, len(rows), array(typecode, flat))
+
+    # Get the index of a position in `cells`. No bounds check.
+    def index(self, pos: Position | tuple[int, int]) -> int:
+        x, y = pos
+        return y * self.width + x
+
+    # Get the position of an index of `cells`.
+    def position(self, i: int) -> Position:
+        y, x = divmod(i, self.width)
+        return Position(x, y)
+
+    # Check if coordinates are within the grid's bounds.
+    def in_bounds(self, pos: Position | tuple[int, int]) -> bool:
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    # Get the value of the cell at the given coordinate.
+    def __getitem__(self, pos: Position | tuple[int, int]) -> int:
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        raise IndexError("Grid indices out of range")
+
+    # Set the value of the cell at the given coordinate.
+    def __setitem__(self, pos: Position | tuple[int, int], value: int):
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[y * self.width + x] = value
+            self._value_index = None
+        else:
+            raise IndexError("Grid indices out of range")
+
+    # Get the value of a cell without checking the bounds. Negative coordinates
+    # silently wrap around, the caller is responsible for passing valid ones.
+    def get_unchecked(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    # Set the value of a cell without checking the bounds.
+    def set_unchecked(self, x: int, y: int, value: int):
+        self.cells[y * self.width + x] = value
+        self._value_index = None
+
+    # Build the index of value -> list of positions.
+    def _build_value_index(self) -> dict[int, list[Position]]:
+        index = {}
+        w = self.width
+        for i, v in enumerate(self.cells):
+            y, x = divmod(i, w)
+            if v in index:
+                index[v].append(Position(x, y))
+            else:
+                index[v] = [Position(x, y)]
+        return index
+
+    # Find a value in the Grid.
+    # @param value: The value to find.
+    # @return: A list of the position of all the cells matching the value. Empty
+    # list if no such cell matches the value. The positions are in row-major
+    # order. The list must not be modified.
+    def find(self, value: int) -> list[Position]:
+        if self._value_index is None:
+            self._value_index = self._build_value_index()
+        return self._value_index.get(value, [])
+
+    # Get a set of all the values contained in the grid.
+    def values(self) -> set[int]:
+        if self._value_index is None:
+            self._value_index = self._build_value_index()
+        return set(self._value_index.keys())
+
+    # Get the indices of the neighbors of every cell.
+    # @return: A list indexed like `cells`. Each entry is the tuple of the
+    # indices of the in-bounds left, right, top and bottom neighbors of the
+    # cell, in that order. The list is computed once and must not be modified.
+    def neighbor_indices(self) -> list[tuple[int, ...]]:
+        if self._neighbors is not None:
+            return self._neighbors
+        w, h = self.width, self.height
+        res = []
+        for y in range(h):
+            for x in range(w):
+                i = y * w + x
+                n = []
+                if x > 0:
+                    n.append(i - 1)
+                if x < w - 1:
+                    n.append(i + 1)
+                if y > 0:
+                    n.append(i - w)
+                if y < h - 1:
+                    n.append(i + w)
+                res.append(tuple(n))
+        self._neighbors = res
+        return res
+
+    # Get the list of neighbors of a particular position.
+    # @param pos: The position to get the neighbors of.
+    # @return: A list of positions indicating the position of all the neighbor
+    # of `pos`. This list is filtered to only contain positions that falls
+    # within the bounds of the grid.
+    def neighbors_of(self, pos: Position) -> list[Position]:
+        x, y = pos
+        res = []
+        if x > 0:
+            res.append(Position(x - 1, y))
+        if x < self.width - 1:
+            res.append(Position(x + 1, y))
+        if y > 0:
+            res.append(Position(x, y - 1))
+        if y < self.height - 1:
+            res.append(Position(x, y + 1))
+        return res
+
+    # Same as neighbors_of but only return diagonal neighbors.
+    def diagonal_neighbors_of(self, pos: Position) -> list[Position]:
+        x, y = pos
+        res = []
+        for dx, dy in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                res.append(Position(nx, ny))
+        return res
+
+    # Get a 2D NumPy array sharing the buffer of the grid, indexed [y, x].
+    # Writing through the view does not invalidate the value index, call
+    # `touch()` afterwards.
+    def numpy_view(self):
+        if numpy is None:
+            raise RuntimeError("NumPy is not installed")
+        if type(self.cells) is bytearray:
+            dtype = numpy.uint8
+        else:
+            # Signed typecodes are lower case.
+            kind = "i" if self.cells.typecode.islower() else "u"
+            dtype = numpy.dtype(f"{kind}{self.cells.itemsize}")
+        view = numpy.frombuffer(self.cells, dtype=dtype)
+        return view.reshape(self.height, self.width)
+
+    # Notify the grid that its cells were modified through `cells` or
+    # `numpy_view()`.
+    def touch(self):
+        self._value_index = None
+
+    def __str__(self):
+        w = self.width
+        rows = []
+        for y in range(self.height):
+            r = self.cells[y * w:(y + 1) * w]
+            if self.text:
+                rows.append("".join(map(chr, r)))
+            else:
+                rows.append("".join(map(str, r)))
+        return "\n".join(rows)
@@ -0,0 +1,155 @@
+#!/bin/python3
+
+# Opt-in instrumentation of the named phases of a solution, e.g. the
+# precomputation of the blizzards of 2022/24 vs the search itself.
+#
+# A day marks its phases with `phase(name)`, either as a decorator or as a
+# context manager:
+#   @phase("search")
+#   def findShortestPath(...):
+#   ...
+#   with phase("shortest paths"):
+#       ...
+# Nothing is recorded unless a recording was started with `recording()`, which
+# is what `python -m aoc.bench --phases` does. When no recording is in
+# progress, entering a phase only costs a function call and a global lookup, so
+# the phases can stay in the code. Phases are meant to be coarse though: do not
+# mark a function called millions of times.
+#
+# For each phase the recording keeps:
+#   - the number of times it was entered, and its total wall time.
+#   - the peak of memory allocated during the phase above what was in use when
+#     entering it, if tracemalloc was started by the recording. This is the max
+#     over all the times the phase was entered.
+#   - the net number of memory blocks allocated during the phase (allocations
+#     minus deallocations, from sys.getallocatedblocks()).
+#   - the number of garbage collections of each generation during the phase.
+# Phases can be nested, a nested phase is recorded under "outer/inner". The time
+# and allocations of a nested phase are also counted in its outer phase.
+
+import contextlib
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import wraps
+
+# Measurements of a phase, accumulated over all the times it was entered.
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    # In seconds.
+    wall: float = 0
+    # In bytes, None if tracemalloc was not tracing.
+    peak_mem: int | None = None
+    alloc_blocks: int = 0
+    gc_collections: list[int] = field(default_factory=lambda: [0, 0, 0])
+
+    def to_json(self) -> dict:
+        return {
+            "calls": self.calls,
+            "wall": self.wall,
+            "peak_mem": self.peak_mem,
+            "alloc_blocks": self.alloc_blocks,
+            "gc_collections": self.gc_collections,
+        }
+
+# Number of garbage collections done so far for each generation.
+def gc_collections() -> list[int]:
+    return [s["collections"] for s in gc.get_stats()]
+
+# The phases being recorded.
+class Recorder:
+    def __init__(self, memory: bool):
+        self.memory = memory
+        self.stats: dict[str, PhaseStats] = {}
+        # One entry per phase currently entered: [path, start wall time, start
+        # blocks, start gc collections, memory in use at start, peak so far].
+        self.stack = []
+
+    def enter(self, name: str):
+        path = name if len(self.stack) == 0 else f"{self.stack[-1][0]}/{name}"
+        current = None
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # tracemalloc has a single peak: save the one of the outer phase
+            # before resetting it for this phase.
+            if len(self.stack):
+                self.stack[-1][5] = max(self.stack[-1][5], peak)
+            tracemalloc.reset_peak()
+        self.stack.append([path, time.perf_counter(), sys.getallocatedblocks(),
+                           gc_collections(), current, 0])
+
+    def exit(self):
+        wall = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+        collections = gc_collections()
+        path, start, start_blocks, start_collections, current, peak = \
+            self.stack.pop()
+        stats = self.stats.get(path)
+        if stats is None:
+            stats = PhaseStats()
+            self.stats[path] = stats
+        stats.calls += 1
+        stats.wall += wall - start
+        stats.alloc_blocks += blocks - start_blocks
+        for i in range(len(collections)):
+            stats.gc_collections[i] += collections[i] - start_collections[i]
+        if self.memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            stats.peak_mem = max(stats.peak_mem or 0, peak - current)
+            # The peak of this phase is also a peak of the outer phase.
+            if len(self.stack):
+                self.stack[-1][5] = max(self.stack[-1][5], peak)
+
+# The recording in progress, if any.
+_recorder: Recorder | None = None
+
+# A named phase, usable as a decorator or as a context manager.
+class phase:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        if _recorder is not None:
+            _recorder.enter(self.name)
+
+    def __exit__(self, *exc):
+        if _recorder is not None:
+            _recorder.exit()
+
+    def __call__(self, func):
+        name = self.name
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            _recorder.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _recorder.exit()
+        return wrapper
+
+# Record the phases entered within the `with` block.
+# @param memory: If True, trace the allocations with tracemalloc to measure the
+# peak memory of each phase. This slows down the code a lot.
+# @return: A dict of phase path -> PhaseStats, filled when the block exits.
+@contextlib.contextmanager
+def recording(memory: bool = False):
+    global _recorder
+    if _recorder is not None:
+        raise RuntimeError("A recording is already in progress")
+    recorder = Recorder(memory)
+    if memory:
+        tracemalloc.start()
+    _recorder = recorder
+    try:
+        yield recorder.stats
+    finally:
+        _recorder = None
+        if memory:
+            tracemalloc.stop()
@@ -0,0 +1,87 @@
+#!/bin/python3
+
+# 2D and 3D positions, shared by all the days working on grids or in space.
+#
+# Positions are immutable and are meant to be used as keys of dicts and sets.
+# They are implemented as tuples rather than plain objects: a tuple of two ints
+# takes less memory than an object and its __dict__, and hashing and comparing
+# them is done in C instead of going through Python-level __hash__/__eq__. This
+# makes a big difference in the flood fills and simulations that keep millions
+# of positions in sets.
+# The arithmetic operators work on the coordinates, they do not concatenate or
+# repeat the tuples. Positions can also be unpacked: `x, y = pos`.
+
+from collections import namedtuple
+
+# Creating the tuples directly is quite a bit faster than going through the
+# __new__ of the namedtuple.
+_new = tuple.__new__
+
+# Representation of a 2D position.
+class Position(namedtuple("Position", ["x", "y"])):
+    __slots__ = ()
+
+    def __new__(cls, x: int, y: int):
+        return _new(cls, (x, y))
+
+    def __repr__(self) -> str:
+        return f"({self[0]}, {self[1]})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __add__(self, other):
+        return _new(Position, (self[0] + other[0], self[1] + other[1]))
+
+    def __sub__(self, other):
+        return _new(Position, (self[0] - other[0], self[1] - other[1]))
+
+    def __neg__(self):
+        return _new(Position, (-self[0], -self[1]))
+
+    def __mul__(self, scalar: int):
+        return _new(Position, (self[0] * scalar, self[1] * scalar))
+
+    __rmul__ = __mul__
+
+    # Compute the Manhattan distance between this position and `other`.
+    def manhattan(self, other) -> int:
+        return abs(self[0] - other[0]) + abs(self[1] - other[1])
+
+# Representation of a 3D position.
+class Position3d(namedtuple("Position3d", ["x", "y", "z"])):
+    __slots__ = ()
+
+    def __new__(cls, x: int, y: int, z: int):
+        return _new(cls, (x, y, z))
+
+    def __repr__(self) -> str:
+        return f"({self[0]}, {self[1]}, {self[2]})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __add__(self, other):
+        return _new(Position3d, (self[0] + other[0],
+                                 self[1] + other[1],
+                                 self[2] + other[2]))
+
+    def __sub__(self, other):
+        return _new(Position3d, (self[0] - other[0],
+                                 self[1] - other[1],
+                                 self[2] - other[2]))
+
+    def __neg__(self):
+        return _new(Position3d, (-self[0], -self[1], -self[2]))
+
+    def __mul__(self, scalar: int):
+        return _new(Position3d, (self[0] * scalar,
+                                 self[1] * scalar,
+                                 self[2] * scalar))
+
+    __rmul__ = __mul__
+
+    # Compute the Manhattan distance between this position and `other`.
+    def manhattan(self, other) -> int:
+        return abs(self[0] - other[0]) + abs(self[1] - other[1]) + \
+            abs(self[2] - other[2])
@@ -0,0 +1,259 @@
+#!/bin/python3
+
+# Run all the days in parallel, e.g. as a regression job.
+#
+# Usage, from the root of the repository:
+#   python -m aoc.runall [-j JOBS] [--timeout SECONDS] [--json FILE] [DAY ...]
+# where DAY is either a year ("2022") or a year/day pair ("2022/16"). Without
+# any DAY, all the days having an input file are run.
+#
+# Every (day, part) pair is a job run in a worker process of its own, at most
+# JOBS of them at the same time. Each job loads the day, parses the input and
+# runs a single part. The jobs known to be the slowest are started first so that
+# they don't end up starting last and holding the whole run: the wall time of
+# the suite should be close to the one of the slowest job given enough cores.
+# Results are printed as soon as a job completes. The timeout is enforced by the
+# parent process: a job running for longer is killed, whatever it is doing, and
+# reported as such. This is why the jobs don't go through a
+# concurrent.futures.ProcessPoolExecutor, whose workers cannot be killed one at
+# a time.
+# Answers are cached on disk (see aoc/cache.py): a job whose solve.py and input
+# did not change since it last completed is answered from the cache without
+# being run. Use --no-cache to run everything anyway.
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from aoc.bench import Day, PARSE_NAMES, PART_NAMES, ROOT, find_days, \
+    has_part_functions, load_module, run_script, select_days, timed
+from aoc.cache import AnswerCache
+
+# Jobs known to take the longest, slowest first. They are scheduled before all
+# the other jobs.
+KNOWN_SLOW = [
+    "2022/16 part2",
+    "2022/19 part1",
+    "2022/19 part2",
+    "2022/24 part2",
+    "2022/24 part1",
+    "2024/6 part2",
+    "2024/7 part2",
+]
+
+# A single part of a day to run.
+@dataclass
+class Job:
+    day: Day
+    # "part1", "part2", or "script" for the days doing all their work at module
+    # level.
+    part: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.day.name} {self.part}"
+
+# Outcome of a job.
+@dataclass
+class JobResult:
+    job: Job
+    # "ok", "timeout" or "error".
+    status: str
+    answer: Any = None
+    # Time spent running the part, excluding the parsing, in seconds.
+    wall: float | None = None
+    error: str | None = None
+    # True if the answer comes from the cache, in which case `wall` is the time
+    # it took when it was computed.
+    cached: bool = False
+
+# List the jobs for a set of days.
+# @param days: The days to create the jobs for.
+# @return: The list of jobs, the known slow jobs first.
+def make_jobs(days: list[Day]) -> list[Job]:
+    jobs = []
+    for day in days:
+        if not has_part_functions(day.script):
+            jobs.append(Job(day, "script"))
+            continue
+        jobs += [Job(day, p) for p in PART_NAMES]
+    # Keep the order of the days for all the other jobs, sort is stable.
+    def priority(job):
+        if job.name in KNOWN_SLOW:
+            return KNOWN_SLOW.index(job.name)
+        return len(KNOWN_SLOW)
+    jobs.sort(key=priority)
+    return jobs
+
+# Run a job. This is executed in a worker process.
+# @param job: The job to run.
+# @return: The JobResult.
+def run_job(job: Job) -> JobResult:
+    try:
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull):
+            if job.part == "script":
+                answer, wall, _ = timed(run_script, job.day)
+                return JobResult(job, "ok", answer, wall)
+            module = load_module(job.day)
+            func = getattr(module, job.part, None)
+            if func is None:
+                # Part never solved for this day.
+                return JobResult(job, "ok")
+            parse = [getattr(module, n) for n in PARSE_NAMES \
+                     if hasattr(module, n)]
+            data = parse[0](job.day.input) if len(parse) else job.day.input
+            answer, wall, _ = timed(func, data)
+            return JobResult(job, "ok", answer, wall)
+    except Exception as e:
+        return JobResult(job, "error", error=f"{type(e).__name__}: {e}")
+
+# Entry point of a worker process: run a job and send its JobResult to the
+# parent through `conn`.
+def job_worker(job: Job, conn: multiprocessing.connection.Connection):
+    conn.send(run_job(job))
+    conn.close()
+
+# Format a result as a single line.
+def format_result(res: JobResult) -> str:
+    if res.status != "ok":
+        return f"{res.job.name:<14} {res.status:>10}  {res.error}"
+    answer = "-" if res.answer is None else str(res.answer)
+    wall = "-" if res.wall is None else f"{res.wall * 1000:.2f}"
+    cached = " (cached)" if res.cached else ""
+    return f"{res.job.name:<14} {wall:>10}  {answer}{cached}"
+
+# Run jobs in worker processes.
+# @param jobs: The jobs to run, in order of submission.
+# @param workers: Maximum number of worker processes running at the same time.
+# @param timeout: Per-job timeout in seconds, None for no limit. The worker of a
+# job running for longer is terminated.
+# @param cache: The AnswerCache to look the jobs up in and to store the answers
+# into, None to run all the jobs.
+# @return: A generator yielding the JobResult as the jobs complete, cache hits
+# first.
+def run_jobs(jobs: list[Job], workers: int, timeout: float | None,
+             cache: AnswerCache | None = None):
+    keys = {}
+    misses = []
+    for j in jobs:
+        if cache is None:
+            misses.append(j)
+            continue
+        key = AnswerCache.key(j.day.script, j.day.input, j.part)
+        entry = cache.get(key)
+        if entry is None:
+            keys[j.name] = key
+            misses.append(j)
+        else:
+            yield JobResult(j, "ok", entry["answer"], entry["wall"],
+                            cached=True)
+    # Maps the connection of each running worker to (job, process, deadline).
+    running = {}
+    try:
+        while len(misses) or len(running):
+            while len(misses) and len(running) < workers:
+                job = misses.pop(0)
+                recv, send = multiprocessing.Pipe(duplex=False)
+                # Not a daemon: a job may start worker processes of its own.
+                process = multiprocessing.Process(target=job_worker,
+                                                  args=(job, send))
+                process.start()
+                # Only the worker writes into the pipe.
+                send.close()
+                deadline = None if timeout is None \
+                    else time.monotonic() + timeout
+                running[recv] = (job, process, deadline)
+
+            deadlines = [d for _, _, d in running.values() if d is not None]
+            wait = None if len(deadlines) == 0 \
+                else max(0, min(deadlines) - time.monotonic())
+            for conn in multiprocessing.connection.wait(running.keys(), wait):
+                job, process, _ = running.pop(conn)
+                try:
+                    res = conn.recv()
+                except EOFError:
+                    # The worker died without sending anything.
+                    process.join()
+                    res = JobResult(job, "error", error="worker exited with " \
+                                    f"code {process.exitcode}")
+                conn.close()
+                process.join()
+                if cache is not None and res.status == "ok":
+                    cache.put(keys[res.job.name], res.answer, res.wall)
+                yield res
+
+            now = time.monotonic()
+            for conn, (job, process, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    del running[conn]
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    yield JobResult(job, "timeout",
+                                    error=f"timed out after {timeout}s")
+    finally:
+        # Do not leave workers behind if the caller stops early.
+        for conn, (_, process, _) in running.items():
+            process.terminate()
+            process.join()
+            conn.close()
+
+# Convert the results to a JSON-serializable object.
+def to_json(results: list[JobResult], wall: float) -> dict:
+    return {
+        "python": sys.version,
+        "wall": wall,
+        "jobs": [{
+            "day": r.job.day.name,
+            "script": os.path.relpath(r.job.day.script, ROOT),
+            "part": r.job.part,
+            "status": r.status,
+            "answer": None if r.answer is None else str(r.answer),
+            "wall": r.wall,
+            "error": r.error,
+            "cached": r.cached,
+        } for r in results]
+    }
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the solutions in parallel.")
+    parser.add_argument("days", nargs="*", metavar="DAY",
+                        help="YEAR or YEAR/DAY to run, default: all")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes, default: one per CPU")
+    parser.add_argument("--timeout", type=float, default=600,
+                        help="maximum time per job in seconds, 0 for no limit")
+    parser.add_argument("--json", metavar="FILE",
+                        help="write the results as JSON into FILE")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="run all the jobs, ignoring the cached answers")
+    args = parser.parse_args(argv)
+
+    jobs = make_jobs(select_days(find_days(), args.days))
+    timeout = args.timeout if args.timeout > 0 else None
+    cache = None if args.no_cache else AnswerCache()
+    start = time.perf_counter()
+    results = []
+    for res in run_jobs(jobs, args.jobs, timeout, cache):
+        print(format_result(res), flush=True)
+        results.append(res)
+    wall = time.perf_counter() - start
+    failed = [r for r in results if r.status != "ok"]
+    print(f"{len(results)} jobs in {wall:.2f}s, {len(failed)} failed")
+
+    if args.json is not None:
+        with open(args.json, "w") as fd:
+            json.dump(to_json(results, wall), fd, indent=2)
+    return 1 if len(failed) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())